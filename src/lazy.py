@@ -0,0 +1,54 @@
+"""
+Lazy package-level exports (PEP 562) shared by the workbench packages.
+
+A package lists its public names and the submodule that defines each one,
+then installs the generated hooks::
+
+    from src.lazy import lazy_exports
+
+    _LAZY_ATTRS = {"Tracer": "tracer", "get_logger": "logger"}
+    __getattr__, __dir__ = lazy_exports(__name__, _LAZY_ATTRS, globals())
+
+Importing the package then loads nothing until one of those names is first
+accessed.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+
+def lazy_exports(
+    package: str,
+    attrs: Mapping[str, str],
+    namespace: Dict[str, Any],
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build a package's module-level ``__getattr__`` and ``__dir__``.
+
+    Parameters
+    ----------
+    package:
+        The package's ``__name__``.
+    attrs:
+        Public name -> submodule of *package* that defines it.
+    namespace:
+        The package's ``globals()``.  Each name is stored there once it has
+        been resolved, so later lookups bypass ``__getattr__``.
+
+    Returns
+    -------
+    tuple
+        ``(__getattr__, __dir__)`` to assign at package level.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = attrs.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(f"{package}.{module_name}"), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(attrs))
+
+    return __getattr__, __dir__
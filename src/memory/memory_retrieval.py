@@ -16,7 +16,7 @@ import math
 import re
 from collections import Counter
 from datetime import datetime
-from typing import Any
+from typing import Any, Sequence
 
 
 # ---------------------------------------------------------------------------
@@ -334,6 +334,20 @@ def _compute_idf(corpus: list[list[str]]) -> dict[str, float]:
     return idf
 
 
+def _informative_terms(
+    query_tokens: list[str],
+    idf: dict[str, float],
+) -> list[str]:
+    """
+    Drop query terms that are absent from the IDF index.
+
+    Such terms match no document and contribute nothing to any score.
+    Terms with a non-positive IDF are kept: they still lower the score
+    of the documents that contain them, which affects ranking.
+    """
+    return [t for t in query_tokens if t in idf]
+
+
 def _score_document(
     query_tokens: list[str],
     doc_tokens: list[str],
@@ -415,6 +429,10 @@ class MemoryRetriever:
         ]
         self._idf = _compute_idf(combined)
 
+        # Immutable snapshot handed out by get_all_memories(); rebuilt
+        # lazily after the corpus changes.
+        self._snapshot: tuple[dict[str, Any], ...] | None = None
+
     @property
     def memory_count(self) -> int:
         """Number of memories in the retriever's corpus."""
@@ -430,6 +448,7 @@ class MemoryRetriever:
             Memory record with at minimum a ``content`` key.
         """
         self._memories.append(memory)
+        self._snapshot = None
         content_tokens = _tokenize(memory.get("content", ""))
         self._corpus_tokens.append(content_tokens)
         tag_str = " ".join(memory.get("tags", []))
@@ -479,6 +498,11 @@ class MemoryRetriever:
         if memories is not None:
             return self._score_external(query_tokens, memories, top_k)
 
+        # Nothing to rank if every query term is unknown to the corpus
+        query_tokens = _informative_terms(query_tokens, self._idf)
+        if not query_tokens:
+            return []
+
         # Score internal corpus
         scored: list[tuple[float, int]] = []
         for idx in range(len(self._memories)):
@@ -519,6 +543,10 @@ class MemoryRetriever:
         combined = [ct + tt for ct, tt in zip(ext_content, ext_tags)]
         ext_idf = _compute_idf(combined) if combined else {}
 
+        query_tokens = _informative_terms(query_tokens, ext_idf)
+        if not query_tokens:
+            return []
+
         scored: list[tuple[float, int]] = []
         for idx in range(len(memories)):
             score = _score_document(
@@ -537,6 +565,14 @@ class MemoryRetriever:
 
         return results
 
-    def get_all_memories(self) -> list[dict[str, Any]]:
-        """Return all memories in the corpus."""
-        return list(self._memories)
+    def get_all_memories(self) -> Sequence[dict[str, Any]]:
+        """
+        Return all memories in the corpus as a read-only sequence.
+
+        The same tuple is returned on every call until the corpus changes,
+        so repeated snapshots cost nothing. Callers that need a mutable
+        list should copy it themselves.
+        """
+        if self._snapshot is None:
+            self._snapshot = tuple(self._memories)
+        return self._snapshot
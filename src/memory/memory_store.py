@@ -8,17 +8,26 @@ historical context for agent analysis.
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any
+import asyncio
+import heapq
+import re
+import sys
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Iterable, Mapping
 
-from google.adk.memory import InMemoryMemoryService
+if TYPE_CHECKING:
+    from google.adk.memory import InMemoryMemoryService
 
 
 # ---------------------------------------------------------------------------
 # Pre-seeded program history facts
 # ---------------------------------------------------------------------------
 
-_PROGRAM_HISTORY_FACTS: list[dict[str, Any]] = [
+# Read-only reference data shared by every store instance.
+_PROGRAM_HISTORY_FACTS: tuple[Mapping[str, Any], ...] = tuple(map(MappingProxyType, [
     # -- Past performance trends --
     {
         "category": "performance_trend",
@@ -28,7 +37,7 @@ _PROGRAM_HISTORY_FACTS: list[dict[str, Any]] = [
             "indicating a persistent and accelerating cost overrun trend."
         ),
         "author": "program_history",
-        "tags": ["evm", "cpi", "cost", "trend"],
+        "tags": ("evm", "cpi", "cost", "trend"),
         "timestamp": "2024-10-01T00:00:00Z",
         "confidence": 1.0,
         "source": "CPR Format 1 Historical Extract",
@@ -40,7 +49,7 @@ _PROGRAM_HISTORY_FACTS: list[dict[str, Any]] = [
             "since then, correlating with the composite wing skin layup delays."
         ),
         "author": "program_history",
-        "tags": ["evm", "spi", "schedule", "trend"],
+        "tags": ("evm", "spi", "schedule", "trend"),
         "timestamp": "2024-10-01T00:00:00Z",
         "confidence": 1.0,
         "source": "CPR Format 1 Historical Extract",
@@ -53,7 +62,7 @@ _PROGRAM_HISTORY_FACTS: list[dict[str, Any]] = [
             "without a significant corrective action or rebaseline."
         ),
         "author": "program_history",
-        "tags": ["evm", "tcpi", "cost", "forecast"],
+        "tags": ("evm", "tcpi", "cost", "forecast"),
         "timestamp": "2024-10-01T00:00:00Z",
         "confidence": 0.95,
         "source": "CPR Format 1 Historical Extract",
@@ -69,7 +78,7 @@ _PROGRAM_HISTORY_FACTS: list[dict[str, Any]] = [
             "All three required rework cycles averaging 12 working days each."
         ),
         "author": "program_history",
-        "tags": ["quality", "wing_assembly", "rework", "recurring"],
+        "tags": ("quality", "wing_assembly", "rework", "recurring"),
         "timestamp": "2024-10-01T00:00:00Z",
         "confidence": 1.0,
         "source": "Quality Escape Log / FRACAS Database",
@@ -82,7 +91,7 @@ _PROGRAM_HISTORY_FACTS: list[dict[str, Any]] = [
             "days per lot, with material scrap costs averaging $145K per occurrence."
         ),
         "author": "program_history",
-        "tags": ["engineering", "ecn", "manufacturing", "disruption"],
+        "tags": ("engineering", "ecn", "manufacturing", "disruption"),
         "timestamp": "2024-10-01T00:00:00Z",
         "confidence": 0.9,
         "source": "Production Disruption Tracker",
@@ -95,7 +104,7 @@ _PROGRAM_HISTORY_FACTS: list[dict[str, Any]] = [
             "to be thermocouple drift, but a definitive corrective action is still pending."
         ),
         "author": "program_history",
-        "tags": ["manufacturing", "composites", "cure_cycle", "quality"],
+        "tags": ("manufacturing", "composites", "cure_cycle", "quality"),
         "timestamp": "2024-09-15T00:00:00Z",
         "confidence": 0.85,
         "source": "Manufacturing Engineering Analysis Report",
@@ -110,7 +119,7 @@ _PROGRAM_HISTORY_FACTS: list[dict[str, Any]] = [
             "Fastener delivery performance drops below 85% OTDP."
         ),
         "author": "program_history",
-        "tags": ["supply_chain", "dual_source", "titanium", "decision"],
+        "tags": ("supply_chain", "dual_source", "titanium", "decision"),
         "timestamp": "2024-06-30T00:00:00Z",
         "confidence": 1.0,
         "source": "Program Decision Memo PDM-2024-017",
@@ -123,7 +132,7 @@ _PROGRAM_HISTORY_FACTS: list[dict[str, Any]] = [
             "report negative variances, with monthly get-well plans required."
         ),
         "author": "program_history",
-        "tags": ["schedule", "rebaseline", "decision", "peo"],
+        "tags": ("schedule", "rebaseline", "decision", "peo"),
         "timestamp": "2024-08-15T00:00:00Z",
         "confidence": 1.0,
         "source": "PEO Direction Memo Aug-2024",
@@ -136,7 +145,7 @@ _PROGRAM_HISTORY_FACTS: list[dict[str, Any]] = [
             "impact of $1.2M. Authorization expires end of Q4 2024."
         ),
         "author": "program_history",
-        "tags": ["cost", "overtime", "structures", "labor", "decision"],
+        "tags": ("cost", "overtime", "structures", "labor", "decision"),
         "timestamp": "2024-09-01T00:00:00Z",
         "confidence": 1.0,
         "source": "Overtime Authorization OTA-2024-009",
@@ -151,7 +160,7 @@ _PROGRAM_HISTORY_FACTS: list[dict[str, Any]] = [
             "expansion), P00027 (+$0.5M, admin realignment). All were bilateral mods."
         ),
         "author": "program_history",
-        "tags": ["contract", "modifications", "cost", "scope"],
+        "tags": ("contract", "modifications", "cost", "scope"),
         "timestamp": "2024-10-01T00:00:00Z",
         "confidence": 1.0,
         "source": "Contract Administration Office Records",
@@ -164,7 +173,7 @@ _PROGRAM_HISTORY_FACTS: list[dict[str, Any]] = [
             "The government's independent estimate is $1.5M."
         ),
         "author": "program_history",
-        "tags": ["contract", "modification", "negotiation", "flight_test"],
+        "tags": ("contract", "modification", "negotiation", "flight_test"),
         "timestamp": "2024-10-01T00:00:00Z",
         "confidence": 0.9,
         "source": "Contract Administration Status Brief",
@@ -178,7 +187,7 @@ _PROGRAM_HISTORY_FACTS: list[dict[str, Any]] = [
             "if not corrected within 2 reporting periods."
         ),
         "author": "program_history",
-        "tags": ["contract", "ceiling", "eac", "nunn_mccurdy", "overrun"],
+        "tags": ("contract", "ceiling", "eac", "nunn_mccurdy", "overrun"),
         "timestamp": "2024-10-01T00:00:00Z",
         "confidence": 0.95,
         "source": "Program Manager's Assessment",
@@ -193,7 +202,7 @@ _PROGRAM_HISTORY_FACTS: list[dict[str, Any]] = [
             "Failure to meet 85% OTDP by Dec 2024 will trigger disqualification review."
         ),
         "author": "program_history",
-        "tags": ["supplier", "apex_fastener", "probation", "quality", "delivery"],
+        "tags": ("supplier", "apex_fastener", "probation", "quality", "delivery"),
         "timestamp": "2024-09-15T00:00:00Z",
         "confidence": 1.0,
         "source": "Supplier Performance Review Board Minutes",
@@ -206,7 +215,7 @@ _PROGRAM_HISTORY_FACTS: list[dict[str, Any]] = [
             "indicated capacity constraints beyond Lot 8 production quantities."
         ),
         "author": "program_history",
-        "tags": ["supplier", "northwind_composites", "performance", "capacity"],
+        "tags": ("supplier", "northwind_composites", "performance", "capacity"),
         "timestamp": "2024-10-01T00:00:00Z",
         "confidence": 0.95,
         "source": "Supplier Performance Review Board Minutes",
@@ -220,12 +229,56 @@ _PROGRAM_HISTORY_FACTS: list[dict[str, Any]] = [
             "turnover in their quality inspection department."
         ),
         "author": "program_history",
-        "tags": ["supplier", "precision_avionics", "quality", "corrective_action"],
+        "tags": ("supplier", "precision_avionics", "quality", "corrective_action"),
         "timestamp": "2024-10-01T00:00:00Z",
         "confidence": 0.9,
         "source": "Supplier Performance Dashboard",
     },
-]
+]))
+
+
+# ---------------------------------------------------------------------------
+# Tokenization
+# ---------------------------------------------------------------------------
+
+# Runs of word characters (letters in any script, digits, underscores;
+# compound tags such as "wing_assembly" stay whole); everything else
+# separates terms, so "cost,trend" yields "cost" and "trend".
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _tokenize(text: str) -> list[str]:
+    """Split text into lowercase terms for the local keyword index."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def _tag_key(tag: str) -> str:
+    """Normalise a tag to its tokens joined by single spaces."""
+    return " ".join(_tokenize(tag))
+
+
+# Sections of the pre-loaded context, in rendering order
+_CONTEXT_SECTION_TITLES: dict[str, str] = {
+    "performance_trend": "PAST PERFORMANCE TRENDS",
+    "recurring_pattern": "RECURRING PATTERNS",
+    "past_decision": "PAST DECISIONS",
+    "contract_history": "CONTRACT HISTORY",
+    "supplier_history": "SUPPLIER HISTORY",
+}
+
+_CONTEXT_HEADER = "\n".join([
+    "=" * 72,
+    "PROGRAM HISTORY CONTEXT (Pre-Loaded Memory)",
+    "=" * 72,
+    "",
+])
+
+_CONTEXT_FOOTER = "=" * 72
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as an ISO-8601 string with second precision."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
 class WorkbenchMemoryStore:
@@ -240,21 +293,50 @@ class WorkbenchMemoryStore:
     """
 
     def __init__(self) -> None:
+        # Imported here so that importing this module stays cheap; the ADK
+        # memory package is only loaded once a store is actually created.
+        from google.adk.memory import InMemoryMemoryService
+
         self._service = InMemoryMemoryService()
         self._memories: list[dict[str, Any]] = []
-        self._preloaded_facts: list[dict[str, Any]] = list(_PROGRAM_HISTORY_FACTS)
-
-        # Pre-seed the memory store with program history facts
+        # Guards the memory list and the indices: add_memory may run
+        # concurrently with searches on worker threads (the store is
+        # shared process-wide via get_shared_store).
+        self._lock = threading.Lock()
+        self._preloaded_facts: tuple[Mapping[str, Any], ...] = _PROGRAM_HISTORY_FACTS
+
+        # Inverted indices (term -> memory positions) for local search.
+        # Positions are appended in insertion order, so each posting list
+        # is sorted and duplicate-free without needing a set.
+        # Tags are keyed by their tokens joined with single spaces, so
+        # "wing-assembly" and "Wing Assembly" are found by the query phrase
+        # "wing assembly"; ``_tag_lengths`` holds the token counts in use.
+        self._content_index: dict[str, list[int]] = {}
+        self._tag_index: dict[str, list[int]] = {}
+        self._tag_lengths: set[int] = set()
+
+        # Memories bucketed by category, in insertion order
+        self._by_category: dict[str, list[dict[str, Any]]] = {}
+
+        # Pre-seed the memory store with program history facts. Author,
+        # source, category and tag strings repeat across facts, so they
+        # are interned to share a single object each.
         for fact in self._preloaded_facts:
             self._memories.append({
                 "content": fact["content"],
-                "author": fact["author"],
-                "tags": list(fact["tags"]),
-                "timestamp": fact.get("timestamp", datetime.utcnow().isoformat()),
+                "author": sys.intern(fact["author"]),
+                "tags": tuple(sys.intern(t) for t in fact["tags"]),
+                "timestamp": fact.get("timestamp") or _utc_timestamp(),
                 "confidence": fact.get("confidence", 1.0),
-                "source": fact.get("source", "program_history"),
-                "category": fact.get("category", "general"),
+                "source": sys.intern(fact.get("source", "program_history")),
+                "category": sys.intern(fact.get("category", "general")),
             })
+            self._index_memory(len(self._memories) - 1)
+
+        # The pre-seeded facts never change after init, so the prompt
+        # context is rendered once: per category, and as the full text.
+        self._section_blocks = self._build_section_blocks()
+        self._preloaded_context = self._join_context(self._section_blocks.values())
 
     # -- public properties --
 
@@ -291,18 +373,21 @@ class WorkbenchMemoryStore:
         Returns
         -------
         dict
-            The stored memory record.
+            The stored memory record. ``tags`` is stored as a tuple.
         """
+        author = sys.intern(author)
         memory = {
             "content": content,
             "author": author,
-            "tags": tags or [],
-            "timestamp": datetime.utcnow().isoformat(),
+            "tags": tuple(sys.intern(t) for t in tags or ()),
+            "timestamp": _utc_timestamp(),
             "confidence": 0.8,
             "source": f"runtime:{author}",
             "category": "runtime",
         }
-        self._memories.append(memory)
+        with self._lock:
+            self._memories.append(memory)
+            self._index_memory(len(self._memories) - 1)
         return memory
 
     async def search(
@@ -333,55 +418,44 @@ class WorkbenchMemoryStore:
             Combined search results with keys ``adk_results`` and
             ``local_matches``.
         """
-        # Delegate to ADK service
-        adk_results = await self._service.search_memory(
-            app_name=app_name,
-            user_id=user_id,
-            query=query,
+        # The ADK lookup and the local keyword scan run concurrently; the
+        # scan is CPU-bound, so it runs on a worker thread to keep the
+        # event loop responsive.
+        adk_results, local_matches = await asyncio.gather(
+            self._service.search_memory(
+                app_name=app_name,
+                user_id=user_id,
+                query=query,
+            ),
+            asyncio.to_thread(self._local_search, query),
         )
 
-        # Local keyword search across pre-seeded + runtime memories
-        query_lower = query.lower()
-        query_terms = set(query_lower.split())
-
-        local_matches: list[dict[str, Any]] = []
-        for mem in self._memories:
-            content_lower = mem["content"].lower()
-            tag_set = {t.lower() for t in mem.get("tags", [])}
-
-            # Score: count of query terms found in content or tags
-            content_hits = sum(1 for t in query_terms if t in content_lower)
-            tag_hits = sum(1 for t in query_terms if t in tag_set)
-            score = content_hits + (tag_hits * 2)  # tags weighted higher
-
-            if score > 0:
-                local_matches.append({**mem, "_relevance_score": score})
-
-        # Sort by relevance score descending
-        local_matches.sort(key=lambda m: m["_relevance_score"], reverse=True)
-
         return {
             "adk_results": adk_results,
-            "local_matches": local_matches[:10],
+            "local_matches": local_matches,
         }
 
     def get_all_memories(self) -> list[dict[str, Any]]:
         """Return all stored memories (pre-seeded and runtime)."""
-        return list(self._memories)
+        with self._lock:
+            return list(self._memories)
 
     def get_memories_by_category(self, category: str) -> list[dict[str, Any]]:
         """Return memories filtered by category."""
-        return [m for m in self._memories if m.get("category") == category]
+        with self._lock:
+            return list(self._by_category.get(category, ()))
 
     def get_memories_by_tag(self, tag: str) -> list[dict[str, Any]]:
         """Return memories that contain the specified tag."""
         tag_lower = tag.lower()
-        return [
-            m for m in self._memories
-            if tag_lower in [t.lower() for t in m.get("tags", [])]
-        ]
-
-    def get_preloaded_context(self) -> str:
+        with self._lock:
+            return [
+                self._memories[idx]
+                for idx in self._tag_index.get(_tag_key(tag), ())
+                if any(t.lower() == tag_lower for t in self._memories[idx]["tags"])
+            ]
+
+    def get_preloaded_context(self, categories: Iterable[str] | None = None) -> str:
         """
         Return a formatted string of all pre-seeded program history facts.
 
@@ -389,18 +463,76 @@ class WorkbenchMemoryStore:
         context so that agents are aware of historical patterns and
         decisions before they begin their analysis.
 
+        Parameters
+        ----------
+        categories : iterable of str, optional
+            Restrict the output to these fact categories (e.g.
+            ``["past_decision", "contract_history"]``). Sections keep their
+            standard order. All categories are included when omitted.
+
         Returns
         -------
         str
-            Multi-section formatted text with all pre-seeded facts.
+            Multi-section formatted text with the selected pre-seeded facts.
         """
-        sections: dict[str, list[str]] = {
-            "performance_trend": [],
-            "recurring_pattern": [],
-            "past_decision": [],
-            "contract_history": [],
-            "supplier_history": [],
-        }
+        if categories is None:
+            return self._preloaded_context
+        wanted = set(categories)
+        return self._join_context(
+            block for cat_key, block in self._section_blocks.items() if cat_key in wanted
+        )
+
+    # -- internal helpers --
+
+    def _local_search(self, query: str) -> list[dict[str, Any]]:
+        """
+        Keyword search across pre-seeded and runtime memories.
+
+        Only memories sharing at least one term with the query are scored.
+        Returns the top 10 matches with an added ``_relevance_score`` key.
+        """
+        # Term-at-a-time scoring over the posting lists: +1 per query term
+        # found in a memory's content, +2 per term matching one of its
+        # tags (tags weighted higher). Memories sharing no term with the
+        # query are never touched.
+        tokens = _tokenize(query)
+        scores: Counter[int] = Counter()
+        with self._lock:
+            for term in set(tokens):
+                scores.update(self._content_index.get(term, ()))
+            # A tag matches when its tokens appear consecutively in the query.
+            for n in self._tag_lengths:
+                phrases = {" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1)}
+                for phrase in phrases:
+                    for idx in self._tag_index.get(phrase, ()):
+                        scores[idx] += 2
+
+            # Top 10 by relevance score descending (ties keep insertion order)
+            top = heapq.nlargest(10, scores.items(), key=lambda item: (item[1], -item[0]))
+            matches = [(self._memories[idx], score) for idx, score in top]
+
+        return [{**memory, "_relevance_score": score} for memory, score in matches]
+
+    def _index_memory(self, idx: int) -> None:
+        """
+        Add the memory at position ``idx`` to the search indices.
+
+        Must be called once per memory, in insertion order, so that each
+        posting list stays sorted and free of duplicates, and with
+        ``_lock`` held once the store may be shared.
+        """
+        memory = self._memories[idx]
+        self._by_category.setdefault(memory.get("category"), []).append(memory)
+        for term in set(_tokenize(memory["content"])):
+            self._content_index.setdefault(term, []).append(idx)
+        for key in {_tag_key(t) for t in memory.get("tags", [])}:
+            if key:
+                self._tag_index.setdefault(key, []).append(idx)
+                self._tag_lengths.add(key.count(" ") + 1)
+
+    def _build_section_blocks(self) -> dict[str, str]:
+        """Render each non-empty fact category into its context section text."""
+        sections: dict[str, list[str]] = {cat_key: [] for cat_key in _CONTEXT_SECTION_TITLES}
 
         for fact in self._preloaded_facts:
             category = fact.get("category", "general")
@@ -408,27 +540,40 @@ class WorkbenchMemoryStore:
                 source_note = f" [Source: {fact['source']}]" if fact.get("source") else ""
                 sections[category].append(f"- {fact['content']}{source_note}")
 
-        section_titles = {
-            "performance_trend": "PAST PERFORMANCE TRENDS",
-            "recurring_pattern": "RECURRING PATTERNS",
-            "past_decision": "PAST DECISIONS",
-            "contract_history": "CONTRACT HISTORY",
-            "supplier_history": "SUPPLIER HISTORY",
+        return {
+            cat_key: "\n".join([f"--- {_CONTEXT_SECTION_TITLES[cat_key]} ---", *items, ""])
+            for cat_key, items in sections.items()
+            if items
         }
 
-        lines: list[str] = [
-            "=" * 72,
-            "PROGRAM HISTORY CONTEXT (Pre-Loaded Memory)",
-            "=" * 72,
-            "",
-        ]
-
-        for cat_key, title in section_titles.items():
-            items = sections.get(cat_key, [])
-            if items:
-                lines.append(f"--- {title} ---")
-                lines.extend(items)
-                lines.append("")
-
-        lines.append("=" * 72)
-        return "\n".join(lines)
+    @staticmethod
+    def _join_context(blocks: Iterable[str]) -> str:
+        """Wrap pre-rendered section blocks in the context header and footer."""
+        return "\n".join([_CONTEXT_HEADER, *blocks, _CONTEXT_FOOTER])
+
+
+# ---------------------------------------------------------------------------
+# Shared store
+# ---------------------------------------------------------------------------
+
+_shared_store: WorkbenchMemoryStore | None = None
+_shared_store_lock = threading.Lock()
+
+
+def get_shared_store() -> WorkbenchMemoryStore:
+    """Return the process-wide :class:`WorkbenchMemoryStore`, creating it once.
+
+    Building a store re-seeds and re-indexes the program history facts, so
+    per-request callers should use this accessor rather than constructing
+    their own. Memories added at runtime via ``add_memory`` are shared by
+    every caller of the returned store; construct a private
+    ``WorkbenchMemoryStore()`` when isolation is required.
+    """
+    global _shared_store
+    if _shared_store is not None:
+        return _shared_store
+    with _shared_store_lock:
+        # Double-check after acquiring lock
+        if _shared_store is None:
+            _shared_store = WorkbenchMemoryStore()
+        return _shared_store
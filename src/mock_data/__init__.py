@@ -1 +1,35 @@
-"""Mock data for demo scenarios."""
+"""Mock data for demo scenarios.
+
+Fixtures can be imported from their submodules directly or from this
+package; package-level names are resolved lazily (PEP 562), so importing
+``src.mock_data`` only loads the dataset module that is actually used.
+"""
+
+from src.lazy import lazy_exports
+
+# Public fixture name -> submodule that defines it.
+_LAZY_ATTRS: dict[str, str] = {
+    "EVM_METRICS": "evm_data",
+    "EVM_HISTORY": "evm_data",
+    "WORK_PACKAGES_BY_WBS": "evm_data",
+    "IMS_MILESTONES": "ims_data",
+    "CRITICAL_PATH": "ims_data",
+    "PROGRAM_SNAPSHOT": "program_data",
+    "WBS_NODES_BY_WBS": "program_data",
+    "RISK_REGISTER": "risk_data",
+    "RISK_SUMMARY": "risk_data",
+    "RISK_BY_ID": "risk_data",
+    "SUPPLIER_METRICS": "supplier_data",
+    "QUALITY_ESCAPE_DATA": "supplier_data",
+    "CARS_BY_ID": "supplier_data",
+    "CONTRACT_BASELINE": "contract_data",
+    "CONTRACT_MODS": "contract_data",
+    "CONTRACT_MODS_BY_NUMBER": "contract_data",
+    "CDRL_LIST": "contract_data",
+    "CDRL_BY_ID": "contract_data",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_ATTRS, globals())
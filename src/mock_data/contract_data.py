@@ -8,7 +8,11 @@ Key narrative: Mod P00027 added cybersecurity CDRL requirements (+$450K,
 +8 weeks), reflecting evolving DoD cybersecurity mandates.
 """
 
-CONTRACT_BASELINE: dict = {
+from typing import Any, Mapping
+
+from src.mock_data.frozen import freeze
+
+CONTRACT_BASELINE: Mapping[str, Any] = freeze({
     "contract_number": "FA8611-21-C-0042",
     "contract_type": "CPIF",
     "prime_contractor": "Meridian Aerospace Systems",
@@ -62,9 +66,9 @@ CONTRACT_BASELINE: dict = {
     "evms_applicable": True,
     "evms_system": "Meridian Aerospace EVM System (DCMA validated 2022-04-12)",
     "security_classification": "UNCLASSIFIED // FOR DEMONSTRATION ONLY",
-}
+})
 
-CONTRACT_MODS: list[dict] = [
+CONTRACT_MODS: tuple[Mapping[str, Any], ...] = freeze([
     {
         "mod_number": "P00001",
         "title": "Administrative Correction - DPAS Rating",
@@ -143,9 +147,9 @@ CONTRACT_MODS: list[dict] = [
         "new_period_of_performance_end": None,
         "cdrl_added": "A012",
     },
-]
+])
 
-CDRL_LIST: list[dict] = [
+CDRL_LIST: tuple[Mapping[str, Any], ...] = freeze([
     {
         "cdrl_id": "A001",
         "did_number": "DI-MGMT-81466B",
@@ -293,4 +297,18 @@ CDRL_LIST: list[dict] = [
             "penetration test results, and ATO package documentation."
         ),
     },
-]
+])
+
+# Lookup indices keyed by the natural record keys, plus precomputed totals
+# over all executed and pending modifications.
+CONTRACT_MODS_BY_NUMBER: dict[str, Mapping[str, Any]] = {
+    m["mod_number"]: m for m in CONTRACT_MODS
+}
+
+CDRL_BY_ID: dict[str, Mapping[str, Any]] = {c["cdrl_id"]: c for c in CDRL_LIST}
+
+CONTRACT_MODS_TOTAL_COST_IMPACT: int = sum(m["cost_impact"] for m in CONTRACT_MODS)
+
+CONTRACT_MODS_TOTAL_SCHEDULE_WEEKS: int = sum(
+    m["schedule_impact_weeks"] for m in CONTRACT_MODS
+)
@@ -10,7 +10,16 @@ variance driver with a CPI of 0.72, caused by supplier quality issues
 at Apex Fastener Corp and rework on composite layup tooling.
 """
 
-EVM_METRICS: dict = {
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+
+from src.mock_data.frozen import freeze
+
+EVM_METRICS: Mapping[str, Any] = freeze({
     # --- Headline indices ---
     "CPI": 0.87,
     "SPI": 0.88,
@@ -137,9 +146,9 @@ EVM_METRICS: dict = {
             ),
         },
     ],
-}
+})
 
-EVM_HISTORY: list[dict] = [
+EVM_HISTORY: tuple[Mapping[str, Any], ...] = freeze([
     {
         "period": "May 2024",
         "month": "2024-05",
@@ -236,4 +245,219 @@ EVM_HISTORY: list[dict] = [
             "potential re-baseline."
         ),
     },
-]
+])
+
+
+# Lookup index keyed by WBS element, so callers resolving a work package
+# by its WBS number do not have to scan the list.
+WORK_PACKAGES_BY_WBS: dict[str, Mapping[str, Any]] = {
+    wp["wbs"]: wp for wp in EVM_METRICS["work_packages"]
+}
+
+_INT32_MAX = np.iinfo(np.int32).max
+
+
+def _dollar_column(records: Sequence[Mapping[str, Any]], key: str) -> np.ndarray:
+    """Return *key* from every record as an ``int32`` array.
+
+    Whole-dollar program values sit well inside the ``int32`` range; the
+    check guards against a fixture change silently wrapping around.
+    """
+    values = [r[key] for r in records]
+    if any(abs(v) > _INT32_MAX for v in values):
+        raise ValueError(f"{key} value exceeds the int32 range")
+    return np.array(values, dtype=np.int32)
+
+
+class WorkPackageStatus(IntEnum):
+    """Work-package health status, stored as ``uint8`` in the column view."""
+
+    GREEN = 0
+    YELLOW = 1
+    RED = 2
+
+
+@dataclass(frozen=True)
+class WorkPackageColumns:
+    """Column-oriented view of ``EVM_METRICS["work_packages"]``.
+
+    Each field is a NumPy array aligned by position with the work-package
+    list, so variance arithmetic can run over every package at once
+    instead of walking the dicts one by one.  Dollar columns are ``int32``
+    so derived variances stay exact at half the width of ``int64``, and
+    ``status`` holds :class:`WorkPackageStatus` codes as ``uint8``.
+    """
+
+    wbs: np.ndarray
+    BCWP: np.ndarray
+    BCWS: np.ndarray
+    ACWP: np.ndarray
+    CPI: np.ndarray
+    SPI: np.ndarray
+    BAC: np.ndarray
+    EAC: np.ndarray
+    status: np.ndarray
+
+    @classmethod
+    def from_records(cls, records: Sequence[Mapping[str, Any]]) -> "WorkPackageColumns":
+        """Build the column arrays from a list of work-package dicts."""
+        def _column(key: str, dtype) -> np.ndarray:
+            return np.array([r[key] for r in records], dtype=dtype)
+
+        return cls(
+            wbs=_column("wbs", object),
+            BCWP=_dollar_column(records, "BCWP"),
+            BCWS=_dollar_column(records, "BCWS"),
+            ACWP=_dollar_column(records, "ACWP"),
+            CPI=_column("CPI", np.float64),
+            SPI=_column("SPI", np.float64),
+            BAC=_dollar_column(records, "BAC"),
+            EAC=_dollar_column(records, "EAC"),
+            status=np.array(
+                [WorkPackageStatus[r["status"].upper()] for r in records],
+                dtype=np.uint8,
+            ),
+        )
+
+
+WORK_PACKAGE_COLUMNS = WorkPackageColumns.from_records(EVM_METRICS["work_packages"])
+
+
+@dataclass(frozen=True)
+class EvmHistoryColumns:
+    """Column-oriented view of ``EVM_HISTORY``.
+
+    ``months`` is a ``datetime64[M]`` array in ascending order, which lets
+    period ranges be located with ``np.searchsorted`` rather than a scan.
+    Cumulative dollar columns and EAC are ``int32`` arrays; the indices stay
+    ``float64`` so values read back out match the source records exactly.
+    """
+
+    months: np.ndarray
+    cum_BCWP: np.ndarray
+    cum_BCWS: np.ndarray
+    cum_ACWP: np.ndarray
+    CPI: np.ndarray
+    SPI: np.ndarray
+    EAC: np.ndarray
+    narrative: tuple
+
+    @classmethod
+    def from_records(cls, records: Sequence[Mapping[str, Any]]) -> "EvmHistoryColumns":
+        """Build the column arrays from a list of monthly history dicts."""
+        def _column(key: str, dtype) -> np.ndarray:
+            return np.array([r[key] for r in records], dtype=dtype)
+
+        return cls(
+            months=_column("month", "datetime64[M]"),
+            cum_BCWP=_dollar_column(records, "cum_BCWP"),
+            cum_BCWS=_dollar_column(records, "cum_BCWS"),
+            cum_ACWP=_dollar_column(records, "cum_ACWP"),
+            CPI=_column("CPI", np.float64),
+            SPI=_column("SPI", np.float64),
+            EAC=_dollar_column(records, "EAC"),
+            narrative=tuple(r["narrative"] for r in records),
+        )
+
+    def __len__(self) -> int:
+        return len(self.months)
+
+    def slice(self, start: str, end: str) -> "EvmHistoryColumns":
+        """Return the periods from *start* to *end* inclusive.
+
+        Parameters
+        ----------
+        start, end:
+            Month strings in ``YYYY-MM`` form.
+
+        Returns
+        -------
+        EvmHistoryColumns
+            A view over the matching periods; empty if none match.
+        """
+        lo = int(np.searchsorted(self.months, np.datetime64(start, "M"), side="left"))
+        hi = int(np.searchsorted(self.months, np.datetime64(end, "M"), side="right"))
+        return EvmHistoryColumns(
+            months=self.months[lo:hi],
+            cum_BCWP=self.cum_BCWP[lo:hi],
+            cum_BCWS=self.cum_BCWS[lo:hi],
+            cum_ACWP=self.cum_ACWP[lo:hi],
+            CPI=self.CPI[lo:hi],
+            SPI=self.SPI[lo:hi],
+            EAC=self.EAC[lo:hi],
+            narrative=self.narrative[lo:hi],
+        )
+
+
+EVM_HISTORY_COLUMNS = EvmHistoryColumns.from_records(EVM_HISTORY)
+
+
+def history_slice(start: str, end: str) -> EvmHistoryColumns:
+    """Return ``EVM_HISTORY_COLUMNS`` restricted to *start*..*end* (``YYYY-MM``)."""
+    return EVM_HISTORY_COLUMNS.slice(start, end)
+
+
+def count_work_packages_by_status(status: str) -> int:
+    """Return how many work packages currently report *status*.
+
+    Parameters
+    ----------
+    status:
+        Status name, e.g. ``"red"`` (case-insensitive).
+
+    Returns
+    -------
+    int
+        Number of matching work packages; ``0`` for an unknown status.
+    """
+    code = WorkPackageStatus.__members__.get(status.upper())
+    if code is None:
+        return 0
+    return _count_work_packages(code)
+
+
+@lru_cache(maxsize=len(WorkPackageStatus))
+def _count_work_packages(code: WorkPackageStatus) -> int:
+    """Count work packages with status *code*.
+
+    Cached per status code rather than per caller string, so the cache
+    holds at most one entry per :class:`WorkPackageStatus` member.
+    """
+    return int(np.count_nonzero(WORK_PACKAGE_COLUMNS.status == code))
+
+
+@lru_cache(maxsize=None)
+def weighted_cpi() -> float:
+    """Return the BCWP-weighted CPI across all work packages (sum BCWP / sum ACWP)."""
+    cols = WORK_PACKAGE_COLUMNS
+    return float(cols.BCWP.sum(dtype=np.int64) / cols.ACWP.sum(dtype=np.int64))
+
+
+def _validate() -> None:
+    """Check the stored EVM figures against their defining identities.
+
+    Indices are published to two decimal places and dollar projections to
+    the whole dollar, so comparisons allow for that rounding.  Runs once at
+    import (skipped under ``python -O``) so consumers can use the stored
+    CPI/SPI/EAC values as-is rather than recomputing them per query.
+    """
+    wp = WORK_PACKAGE_COLUMNS
+    assert np.allclose(wp.BCWP / wp.ACWP, wp.CPI, rtol=0, atol=0.005), \
+        "work-package CPI does not match BCWP / ACWP"
+    assert np.allclose(wp.BCWP / wp.BCWS, wp.SPI, rtol=0, atol=0.005), \
+        "work-package SPI does not match BCWP / BCWS"
+    assert np.allclose(wp.BAC / wp.CPI, wp.EAC, rtol=0, atol=1), \
+        "work-package EAC does not match BAC / CPI"
+
+    hist = EVM_HISTORY_COLUMNS
+    sv = np.array([h["SV"] for h in EVM_HISTORY], dtype=np.int32)
+    assert np.array_equal(hist.cum_BCWP - hist.cum_BCWS, sv), \
+        "history SV does not match BCWP - BCWS"
+    assert np.allclose(hist.cum_BCWP / hist.cum_ACWP, hist.CPI, rtol=0, atol=0.005), \
+        "history CPI does not match BCWP / ACWP"
+    assert np.allclose(EVM_METRICS["BAC"] / hist.CPI, hist.EAC, rtol=0, atol=1), \
+        "history EAC does not match BAC / CPI"
+
+
+if __debug__:
+    _validate()
@@ -0,0 +1,54 @@
+"""
+Read-only wrappers for the mock data fixtures.
+
+Fixtures are published as ``MappingProxyType`` mappings and tuples so they
+can be shared between tools and threads without risk of one caller mutating
+another's view.  ``thaw`` produces a fresh plain ``dict``/``list`` copy for
+callers that need a JSON-serializable or mutable structure.
+"""
+
+from types import MappingProxyType
+from typing import Any, Mapping
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples.
+
+    Parameters
+    ----------
+    value:
+        A fixture built from dict/list literals.
+
+    Returns
+    -------
+    Any
+        The same structure with every ``dict`` wrapped in
+        ``MappingProxyType`` and every ``list`` converted to a ``tuple``.
+        Scalars are returned unchanged.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Return a mutable, JSON-serializable deep copy of a frozen fixture.
+
+    Parameters
+    ----------
+    value:
+        A structure produced by :func:`freeze` (or any nesting of
+        mappings, tuples and lists).
+
+    Returns
+    -------
+    Any
+        A new structure with mappings as ``dict`` and sequences as ``list``.
+    """
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, (tuple, list)):
+        return [thaw(v) for v in value]
+    return value
@@ -10,7 +10,15 @@ Key narrative: The "Wing Assembly Complete" milestone (MS-006) has slipped
 downstream milestones at risk.
 """
 
-IMS_MILESTONES: list[dict] = [
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+
+from src.mock_data.frozen import freeze
+
+IMS_MILESTONES: tuple[Mapping[str, Any], ...] = freeze([
     {
         "milestone_id": "MS-001",
         "title": "System Requirements Review (SRR)",
@@ -160,9 +168,9 @@ IMS_MILESTONES: list[dict] = [
             "Flight Test Readiness Review (FTRR) planning underway."
         ),
     },
-]
+])
 
-CRITICAL_PATH: dict = {
+CRITICAL_PATH: Mapping[str, Any] = freeze({
     "description": (
         "The current critical path runs through the Wing Assembly work "
         "package (WBS 1.3.2). The Apex Fastener Corp quality escape has "
@@ -214,4 +222,166 @@ CRITICAL_PATH: dict = {
             "wing sub-assemblies."
         ),
     },
+})
+
+
+class MilestoneStatus(IntEnum):
+    """Milestone status, stored as ``uint8`` in the column view."""
+
+    COMPLETED = 0
+    ON_TRACK = 1
+    AT_RISK = 2
+    SLIPPED = 3
+
+
+@dataclass(frozen=True)
+class MilestoneColumns:
+    """Column-oriented view of ``IMS_MILESTONES`` with dates pre-parsed.
+
+    Date fields are ``datetime64[D]`` arrays aligned by position with the
+    milestone list (``NaT`` where a milestone has no actual date), so date
+    arithmetic and schedule scans run in NumPy without re-parsing the ISO
+    strings.  ``slip_days`` is measured from the baseline to the actual
+    date for completed milestones and to the forecast date otherwise, and
+    ``status`` holds :class:`MilestoneStatus` codes as ``uint8``.
+    """
+
+    milestone_id: np.ndarray
+    baseline_date: np.ndarray
+    forecast_date: np.ndarray
+    actual_date: np.ndarray
+    slip_days: np.ndarray
+    status: np.ndarray
+
+    @classmethod
+    def from_records(cls, records: Sequence[Mapping[str, Any]]) -> "MilestoneColumns":
+        """Build the column arrays from a list of milestone dicts."""
+        def _dates(key: str) -> np.ndarray:
+            return np.array(
+                [r[key] or "NaT" for r in records], dtype="datetime64[D]"
+            )
+
+        baseline = _dates("baseline_date")
+        forecast = _dates("forecast_date")
+        actual = _dates("actual_date")
+        finish = np.where(np.isnat(actual), forecast, actual)
+        return cls(
+            milestone_id=np.array([r["milestone_id"] for r in records], dtype=object),
+            baseline_date=baseline,
+            forecast_date=forecast,
+            actual_date=actual,
+            slip_days=(finish - baseline).astype(np.int32),
+            status=np.array(
+                [MilestoneStatus[r["status"].upper()] for r in records],
+                dtype=np.uint8,
+            ),
+        )
+
+    def take(self, positions: np.ndarray) -> "MilestoneColumns":
+        """Return the columns for the milestones at *positions*, in that order."""
+        return MilestoneColumns(
+            milestone_id=self.milestone_id[positions],
+            baseline_date=self.baseline_date[positions],
+            forecast_date=self.forecast_date[positions],
+            actual_date=self.actual_date[positions],
+            slip_days=self.slip_days[positions],
+            status=self.status[positions],
+        )
+
+
+MILESTONE_COLUMNS = MilestoneColumns.from_records(IMS_MILESTONES)
+
+
+# Milestones whose status is at risk or slipped, as a boolean mask aligned
+# with IMS_MILESTONES.
+KEY_RISK_MASK: np.ndarray = np.isin(
+    MILESTONE_COLUMNS.status, (MilestoneStatus.AT_RISK, MilestoneStatus.SLIPPED)
+)
+
+
+def key_risk_milestones() -> np.ndarray:
+    """Return the positions in ``IMS_MILESTONES`` of at-risk or slipped milestones."""
+    return np.flatnonzero(KEY_RISK_MASK)
+
+
+# Position of each milestone within IMS_MILESTONES, keyed by milestone ID.
+_MILESTONE_POSITION: dict[str, int] = {
+    m["milestone_id"]: i for i, m in enumerate(IMS_MILESTONES)
 }
+
+# Critical path as positions into IMS_MILESTONES, with a flag for the
+# milestone(s) driving the delay and a membership mask over all milestones.
+CRITICAL_PATH_IDX: np.ndarray = np.array(
+    [_MILESTONE_POSITION[e["milestone_id"]] for e in CRITICAL_PATH["critical_path_sequence"]],
+    dtype=np.int32,
+)
+CRITICAL_PATH_DRIVING: np.ndarray = np.array(
+    [e.get("driving_delay", False) for e in CRITICAL_PATH["critical_path_sequence"]],
+    dtype=bool,
+)
+CRITICAL_PATH_MASK: np.ndarray = np.zeros(len(IMS_MILESTONES), dtype=bool)
+CRITICAL_PATH_MASK[CRITICAL_PATH_IDX] = True
+
+
+def critical_path_view() -> MilestoneColumns:
+    """Return the milestone columns for the critical path, in path order."""
+    return MILESTONE_COLUMNS.take(CRITICAL_PATH_IDX)
+
+
+def _path_edges(paths: Sequence[Sequence[str]]) -> np.ndarray:
+    """Return the unique (predecessor, successor) position pairs of *paths*."""
+    edges: list[tuple[int, int]] = []
+    for path in paths:
+        for src, dst in zip(path, path[1:]):
+            edge = (_MILESTONE_POSITION[src], _MILESTONE_POSITION[dst])
+            if edge not in edges:
+                edges.append(edge)
+    return np.array(edges, dtype=np.int32).reshape(-1, 2)
+
+
+# Milestone dependency edges implied by the critical and near-critical
+# paths, as rows of (predecessor, successor) positions into IMS_MILESTONES.
+MILESTONE_EDGES: np.ndarray = _path_edges(
+    [[e["milestone_id"] for e in CRITICAL_PATH["critical_path_sequence"]]]
+    + [p["milestones"] for p in CRITICAL_PATH["near_critical_paths"]]
+)
+
+
+def propagate_slip(slip_days: np.ndarray | None = None) -> np.ndarray:
+    """Propagate slip forward through the milestone dependency graph.
+
+    Each milestone's propagated slip is the larger of its own slip and the
+    propagated slip of any predecessor along ``MILESTONE_EDGES``, computed
+    in topological order.
+
+    Parameters
+    ----------
+    slip_days:
+        Per-milestone slip aligned with ``IMS_MILESTONES``.  Defaults to
+        ``MILESTONE_COLUMNS.slip_days``.
+
+    Returns
+    -------
+    numpy.ndarray
+        Propagated slip in days for every milestone.
+    """
+    if slip_days is None:
+        slip_days = MILESTONE_COLUMNS.slip_days
+    result = np.array(slip_days, dtype=np.int32)
+    n = len(result)
+    successors: list[list[int]] = [[] for _ in range(n)]
+    indegree = [0] * n
+    for src, dst in MILESTONE_EDGES.tolist():
+        successors[src].append(dst)
+        indegree[dst] += 1
+
+    ready = [i for i in range(n) if indegree[i] == 0]
+    while ready:
+        node = ready.pop()
+        for nxt in successors[node]:
+            if result[node] > result[nxt]:
+                result[nxt] = result[node]
+            indegree[nxt] -= 1
+            if indegree[nxt] == 0:
+                ready.append(nxt)
+    return result
@@ -5,7 +5,12 @@ Provides top-level program metadata, key personnel, budget summary,
 and WBS structure used across all demo scenarios.
 """
 
-PROGRAM_SNAPSHOT: dict = {
+from functools import lru_cache
+from typing import Any, Iterator, Mapping
+
+from src.mock_data.frozen import freeze
+
+PROGRAM_SNAPSHOT: Mapping[str, Any] = freeze({
     "program_name": "Advanced Fighter Program (AFP)",
     "contract_number": "FA8611-21-C-0042",
     "prime_contractor": "Meridian Aerospace Systems",
@@ -147,4 +152,72 @@ PROGRAM_SNAPSHOT: dict = {
             "level": 2,
         },
     ],
+})
+
+# Lookup index keyed by WBS element over the program-level WBS summary.
+WBS_NODES_BY_WBS: dict[str, Mapping[str, Any]] = {
+    node["wbs"]: node for node in PROGRAM_SNAPSHOT["wbs_summary"]
 }
+
+_WBS_ROOT = "1.0"
+
+
+def _wbs_parent(wbs: str) -> str | None:
+    """Return the parent WBS number (``"1.3.2"`` -> ``"1.3"``, ``"1.3"`` -> ``"1.0"``)."""
+    if wbs == _WBS_ROOT:
+        return None
+    head = wbs.rpartition(".")[0]
+    return head if "." in head else f"{head}.0"
+
+
+# Child WBS numbers of each node, in summary order.
+_WBS_CHILDREN: dict[str, list[str]] = {wbs: [] for wbs in WBS_NODES_BY_WBS}
+for _wbs in WBS_NODES_BY_WBS:
+    _parent = _wbs_parent(_wbs)
+    if _parent in _WBS_CHILDREN:
+        _WBS_CHILDREN[_parent].append(_wbs)
+del _wbs, _parent
+
+
+def walk_wbs(root: str = _WBS_ROOT) -> Iterator[Mapping[str, Any]]:
+    """Yield the WBS summary nodes under *root* in depth-first order.
+
+    Parameters
+    ----------
+    root:
+        WBS number to start from; the node itself is yielded first.
+        Unknown WBS numbers yield nothing.
+
+    Returns
+    -------
+    Iterator[Mapping[str, Any]]
+        The matching ``wbs_summary`` nodes.
+    """
+    stack = [root] if root in WBS_NODES_BY_WBS else []
+    while stack:
+        wbs = stack.pop()
+        yield WBS_NODES_BY_WBS[wbs]
+        stack.extend(reversed(_WBS_CHILDREN[wbs]))
+
+
+@lru_cache(maxsize=None)
+def rollup_budget(root: str = _WBS_ROOT) -> int:
+    """Sum the budgets of the lowest-level WBS elements under *root*.
+
+    Results are cached per *root*; the WBS summary is read-only.
+
+    Parameters
+    ----------
+    root:
+        WBS number to roll up from.
+
+    Returns
+    -------
+    int
+        Total leaf-level budget in USD (``0`` for an unknown WBS number).
+    """
+    return sum(
+        node["budget"]
+        for node in walk_wbs(root)
+        if not _WBS_CHILDREN[node["wbs"]]
+    )
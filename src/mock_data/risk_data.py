@@ -8,7 +8,15 @@ mitigation plans, and ownership. Risk scores use a 5x5 matrix
 Aligned with the October 2024 reporting period.
 """
 
-RISK_REGISTER: list[dict] = [
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+
+from src.mock_data.frozen import freeze
+
+RISK_REGISTER: tuple[Mapping[str, Any], ...] = freeze([
     {
         "risk_id": "R-001",
         "title": "Supplier Fastener Quality Deficiency",
@@ -284,18 +292,109 @@ RISK_REGISTER: list[dict] = [
         "cost_impact_estimate": 180_000,
         "schedule_impact_days": 0,
     },
-]
+])
+
+# Lookup index keyed by risk ID.
+RISK_BY_ID: dict[str, Mapping[str, Any]] = {r["risk_id"]: r for r in RISK_REGISTER}
+
+
+class RiskLevel(IntEnum):
+    """Risk level, ordered by severity; stored as ``uint8`` in the column view."""
+
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+    CRITICAL = 3
+
+
+class RiskStatus(IntEnum):
+    """Risk status; stored as ``uint8`` in the column view."""
+
+    ACTIVE = 0
+    WATCH = 1
+    CLOSED = 2
+
+
+@dataclass(frozen=True)
+class RiskColumns:
+    """Column-oriented view of ``RISK_REGISTER``.
+
+    Each field is a NumPy array aligned by position with the register, so
+    exposure totals and score filters run as array operations rather than
+    per-risk dict lookups.  Scores fit in ``int8`` (1-25) and schedule
+    impacts in ``int16``; ``risk_level`` and ``status`` hold
+    :class:`RiskLevel` / :class:`RiskStatus` codes as ``uint8``, and the
+    identification and last-update dates are pre-parsed ``datetime64[D]``.
+    Prose fields stay on the dict records.
+    """
+
+    risk_id: np.ndarray
+    probability: np.ndarray
+    probability_score: np.ndarray
+    impact_score: np.ndarray
+    risk_score: np.ndarray
+    cost_impact_estimate: np.ndarray
+    schedule_impact_days: np.ndarray
+    risk_level: np.ndarray
+    status: np.ndarray
+    date_identified: np.ndarray
+    last_updated: np.ndarray
+
+    @classmethod
+    def from_records(cls, records: Sequence[Mapping[str, Any]]) -> "RiskColumns":
+        """Build the column arrays from a list of risk dicts."""
+        def _column(key: str, dtype) -> np.ndarray:
+            return np.array([r[key] for r in records], dtype=dtype)
+
+        return cls(
+            risk_id=_column("risk_id", object),
+            probability=_column("probability", np.float64),
+            probability_score=_column("probability_score", np.int8),
+            impact_score=_column("impact_score", np.int8),
+            risk_score=_column("risk_score", np.int8),
+            cost_impact_estimate=_column("cost_impact_estimate", np.int64),
+            schedule_impact_days=_column("schedule_impact_days", np.int16),
+            risk_level=np.array(
+                [RiskLevel[r["risk_level"].upper()] for r in records],
+                dtype=np.uint8,
+            ),
+            status=np.array(
+                [RiskStatus[r["status"].upper()] for r in records],
+                dtype=np.uint8,
+            ),
+            date_identified=_column("date_identified", "datetime64[D]"),
+            last_updated=_column("last_updated", "datetime64[D]"),
+        )
+
+
+RISK_COLUMNS = RiskColumns.from_records(RISK_REGISTER)
+
+
+def filter_by_score(min_score: int) -> np.ndarray:
+    """Return the positions in ``RISK_REGISTER`` of risks scoring at least *min_score*."""
+    return np.flatnonzero(RISK_COLUMNS.risk_score >= min_score)
+
+
+def _summarize(cols: RiskColumns) -> Mapping[str, Any]:
+    """Derive the register summary (counts, top risk, exposure) from *cols*."""
+    levels = np.bincount(cols.risk_level, minlength=len(RiskLevel))
+    statuses = np.bincount(cols.status, minlength=len(RiskStatus))
+    top = int(np.argmax(cols.risk_score)) if len(cols.risk_id) else None
+    return freeze({
+        "total_risks": len(cols.risk_id),
+        "critical": int(levels[RiskLevel.CRITICAL]),
+        "high": int(levels[RiskLevel.HIGH]),
+        "medium": int(levels[RiskLevel.MEDIUM]),
+        "low": int(levels[RiskLevel.LOW]),
+        "active": int(statuses[RiskStatus.ACTIVE]),
+        "watch": int(statuses[RiskStatus.WATCH]),
+        "closed": int(statuses[RiskStatus.CLOSED]),
+        "top_risk": cols.risk_id[top] if top is not None else None,
+        "total_cost_exposure": int(cols.cost_impact_estimate.sum()),
+        "reporting_period": "October 2024",
+    })
+
 
-RISK_SUMMARY: dict = {
-    "total_risks": 8,
-    "critical": 1,
-    "high": 1,
-    "medium": 3,
-    "low": 3,
-    "active": 5,
-    "watch": 3,
-    "closed": 0,
-    "top_risk": "R-001",
-    "total_cost_exposure": 9_000_000,
-    "reporting_period": "October 2024",
-}
+# Summary statistics derived from the register at import, so they cannot
+# drift from the individual risk records.
+RISK_SUMMARY: Mapping[str, Any] = _summarize(RISK_COLUMNS)
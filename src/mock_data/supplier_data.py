@@ -11,7 +11,14 @@ active quality escape affecting 240 fastener units across 12 wing
 sub-assemblies.
 """
 
-SUPPLIER_METRICS: dict[str, dict] = {
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+import numpy as np
+
+from src.mock_data.frozen import freeze
+
+SUPPLIER_METRICS: Mapping[str, Mapping[str, Any]] = freeze({
     "Apex Fastener Corp": {
         "supplier_id": "SUP-001",
         "cage_code": "5K2M9",
@@ -270,9 +277,9 @@ SUPPLIER_METRICS: dict[str, dict] = {
             "through GFE IPT."
         ),
     },
-}
+})
 
-QUALITY_ESCAPE_DATA: dict = {
+QUALITY_ESCAPE_DATA: Mapping[str, Any] = freeze({
     "escape_id": "QE-2024-003",
     "title": "Defective Wing Fasteners - Apex Fastener Corp",
     "severity": "critical",
@@ -375,4 +382,64 @@ QUALITY_ESCAPE_DATA: dict = {
             "should be implemented early in EMD."
         ),
     ],
+})
+
+# Lookup index from corrective action request ID to the owning supplier
+# name and the CAR record.
+CARS_BY_ID: dict[str, tuple[str, Mapping[str, Any]]] = {
+    car["car_id"]: (name, car)
+    for name, supplier in SUPPLIER_METRICS.items()
+    for car in supplier["corrective_actions"]
 }
+
+
+@dataclass(frozen=True)
+class SupplierColumns:
+    """Column-oriented view of ``SUPPLIER_METRICS``.
+
+    Rows follow the supplier order of ``SUPPLIER_METRICS``.  DPMO figures
+    can reach 1,000,000, so they are stored as ``uint32``; ``otdp_history``
+    is an (n_suppliers, n_periods) matrix whose columns are labelled by
+    ``periods``.  OTDP values stay ``float64`` so they read back exactly as
+    published.
+    """
+
+    name: tuple
+    otdp: np.ndarray
+    dpmo: np.ndarray
+    dpmo_industry_benchmark: np.ndarray
+    periods: tuple
+    otdp_history: np.ndarray
+
+    @classmethod
+    def from_metrics(cls, metrics: Mapping[str, Mapping[str, Any]]) -> "SupplierColumns":
+        """Build the columns from a supplier-name -> metrics mapping."""
+        records = list(metrics.values())
+        periods = tuple(h["period"] for h in records[0]["otdp_history"]) if records else ()
+        for r in records:
+            if tuple(h["period"] for h in r["otdp_history"]) != periods:
+                raise ValueError(
+                    f"{r['supplier_id']} OTDP history periods differ from {periods}"
+                )
+        return cls(
+            name=tuple(metrics),
+            otdp=np.array([r["otdp"] for r in records], dtype=np.float64),
+            dpmo=np.array([r["dpmo"] for r in records], dtype=np.uint32),
+            dpmo_industry_benchmark=np.array(
+                [r["dpmo_industry_benchmark"] for r in records], dtype=np.uint32
+            ),
+            periods=periods,
+            otdp_history=np.array(
+                [[h["otdp"] for h in r["otdp_history"]] for r in records],
+                dtype=np.float64,
+            ).reshape(len(records), len(periods)),
+        )
+
+    def otdp_change_per_period(self) -> np.ndarray:
+        """Return each supplier's mean period-over-period OTDP change."""
+        if self.otdp_history.shape[1] < 2:
+            return np.zeros(len(self.name))
+        return np.diff(self.otdp_history, axis=1).mean(axis=1)
+
+
+SUPPLIER_COLUMNS = SupplierColumns.from_metrics(SUPPLIER_METRICS)
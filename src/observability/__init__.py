@@ -1,13 +1,24 @@
-"""Observability system for the Program Execution Workbench."""
+"""Observability system for the Program Execution Workbench.
 
-from src.observability.logger import (
-    WorkbenchLogger,
-    get_logger,
-    log_tool_call,
-    log_agent_event,
-)
-from src.observability.metrics import MetricsCollector
-from src.observability.tracer import TraceContext, Tracer, ExecutionReport
+Package-level names are resolved lazily (PEP 562): importing
+``src.observability`` loads only the submodule (logger, metrics or tracer)
+whose export is first accessed.
+"""
+
+from src.lazy import lazy_exports
+
+# Public name -> submodule that defines it.
+_LAZY_ATTRS: dict[str, str] = {
+    "WorkbenchLogger": "logger",
+    "get_logger": "logger",
+    "log_tool_call": "logger",
+    "log_agent_event": "logger",
+    "MetricsCollector": "metrics",
+    "TraceContext": "tracer",
+    "Tracer": "tracer",
+    "NullTracer": "tracer",
+    "ExecutionReport": "tracer",
+}
 
 __all__ = [
     "WorkbenchLogger",
@@ -17,5 +28,9 @@ __all__ = [
     "MetricsCollector",
     "TraceContext",
     "Tracer",
+    "NullTracer",
     "ExecutionReport",
 ]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_ATTRS, globals())
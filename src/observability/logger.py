@@ -15,14 +15,18 @@ Usage:
     log_agent_event("pm_agent", "plan_generated", {"steps": 3}, trace_id)
 """
 
+import atexit
 import json
 import logging
+import math
 import os
+import queue
 import sys
 import threading
 import time
 import uuid
-from datetime import datetime, timezone
+from json.encoder import encode_basestring_ascii
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -34,21 +38,16 @@ from typing import Any, Dict, Optional
 # ---------------------------------------------------------------------------
 _PROJECT_ROOT = Path(__file__).resolve().parents[2]
 _LOGS_DIR = _PROJECT_ROOT / "logs"
-
-# Thread lock for one-time directory creation
-_dir_lock = threading.Lock()
-_dir_created = False
+_LOG_FILE = str(_LOGS_DIR / "workbench.log")
 
 
 def _ensure_logs_dir() -> Path:
-    """Create the logs/ directory if it does not already exist (thread-safe)."""
-    global _dir_created
-    if _dir_created:
-        return _LOGS_DIR
-    with _dir_lock:
-        if not _dir_created:
-            _LOGS_DIR.mkdir(parents=True, exist_ok=True)
-            _dir_created = True
+    """Create the logs/ directory if it does not already exist.
+
+    Only called while the shared file handler is being created, which
+    happens once per process under ``_listener_lock``.
+    """
+    _LOGS_DIR.mkdir(parents=True, exist_ok=True)
     return _LOGS_DIR
 
 
@@ -56,34 +55,325 @@ def _ensure_logs_dir() -> Path:
 # JSON Formatter
 # ---------------------------------------------------------------------------
 
+# (whole_seconds, "YYYY-MM-DDTHH:MM:SS") for the most recently formatted
+# second; consecutive records almost always share it.
+_ts_cache: tuple = (None, "")
+
+
+def _utc_isoformat(created: float) -> str:
+    """Format a ``time.time()`` value like ``datetime.isoformat()`` in UTC.
+
+    Output is identical to
+    ``datetime.fromtimestamp(created, timezone.utc).isoformat()`` (including
+    half-even microsecond rounding and the omitted fraction when it is
+    zero), but the date/time part is only rebuilt when the second changes.
+    """
+    global _ts_cache
+    frac, whole = math.modf(created)
+    seconds = int(whole)
+    micros = round(frac * 1e6)
+    if micros >= 1000000:
+        seconds += 1
+        micros -= 1000000
+    cached_seconds, base = _ts_cache
+    if cached_seconds != seconds:
+        base = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _ts_cache = (seconds, base)
+    if micros:
+        return f"{base}.{micros:06d}+00:00"
+    return base + "+00:00"
+
+
+# json.dumps() builds a new JSONEncoder whenever a non-default option such as
+# ``default`` is passed; reuse one instead.
+_JSON_ENCODER = json.JSONEncoder(default=str)
+
+
+def _json_value(value: Any) -> str:
+    """JSON-encode a scalar field, skipping the encoder for str and None."""
+    if type(value) is str:
+        return encode_basestring_ascii(value)
+    if value is None:
+        return "null"
+    return _JSON_ENCODER.encode(value)
+
+
 class _JsonFormatter(logging.Formatter):
-    """Formats each log record as a single-line JSON object."""
+    """Formats each log record as a single-line JSON object.
+
+    The fixed leading keys are written from a string template and only the
+    values are escaped; the general-purpose encoder is used just for
+    ``extra_data``.  The output is byte-identical to ``json.dumps`` of the
+    equivalent entry dict.
+    """
 
     def format(self, record: logging.LogRecord) -> str:
-        entry: Dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "level": record.levelname,
-            "trace_id": getattr(record, "trace_id", None),
-            "agent_name": getattr(record, "agent_name", None),
-            "message": record.getMessage(),
-        }
-
-        # Merge any extra_data attached to the record
-        extra_data = getattr(record, "extra_data", None)
-        if extra_data is not None:
-            entry["extra_data"] = extra_data
+        # The timestamp is produced by _utc_isoformat and needs no escaping.
+        out = (
+            f'{{"timestamp": "{_utc_isoformat(record.created)}", '
+            f'"level": {encode_basestring_ascii(record.levelname)}, '
+            f'"trace_id": {_json_value(getattr(record, "trace_id", None))}, '
+            f'"agent_name": {_json_value(getattr(record, "agent_name", None))}, '
+            f'"message": {encode_basestring_ascii(record.getMessage())}'
+        )
+
+        # Merge any extra_data attached to the record (already encoded if
+        # the record passed through _InProcessQueueHandler)
+        extra_json = getattr(record, "extra_data_json", None)
+        if extra_json is None:
+            extra_data = getattr(record, "extra_data", None)
+            if extra_data is not None:
+                extra_json = _JSON_ENCODER.encode(extra_data)
+        if extra_json is not None:
+            out += ', "extra_data": ' + extra_json
 
         # Capture exception info when present
-        if record.exc_info and record.exc_info[1] is not None:
-            entry["exception"] = self.formatException(record.exc_info)
+        exc_info = record.exc_info
+        if exc_info and exc_info[1] is not None:
+            out += ', "exception": ' + encode_basestring_ascii(
+                self.formatException(exc_info)
+            )
+
+        return out + "}"
+
+
+# Formatters are stateless, so one instance serves every handler.
+_JSON_FORMATTER = _JsonFormatter()
+
+
+# ---------------------------------------------------------------------------
+# Background writer
+#
+# Every WorkbenchLogger shares one QueueHandler, so loggers only enqueue
+# records; a single process-wide QueueListener thread owns the console and
+# file handlers (one open workbench.log for the whole process), so callers
+# never block on disk I/O.
+# ---------------------------------------------------------------------------
 
-        return json.dumps(entry, default=str)
+# Once this many records are waiting, records below _DROP_BELOW_LEVEL are
+# discarded instead of queued; WARNING and above are always kept.
+_LOG_QUEUE_SIZE = 10000
+_DROP_BELOW_LEVEL = logging.WARNING
+_FILE_BUFFER_SIZE = 64 * 1024
+_FLUSH_INTERVAL_S = 0.25
+
+_listener_lock = threading.Lock()
+_queue_handler: Optional["_InProcessQueueHandler"] = None
+_listener: Optional[QueueListener] = None
+_flush_stop = threading.Event()
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler that does not flush after every record.
+
+    The stock handler flushes on each ``emit``, costing one ``write()``
+    syscall per record.  This one writes into a 64 KiB buffer and relies on
+    :func:`_flush_periodically` (and shutdown) to push it to disk.
+    """
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=_FILE_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def _flush_periodically(handler: logging.Handler) -> None:
+    """Flush *handler* every ``_FLUSH_INTERVAL_S`` until shutdown."""
+    while not _flush_stop.wait(_FLUSH_INTERVAL_S):
+        handler.flush()
+
+
+def _shutdown(listener: QueueListener, file_handler: logging.Handler) -> None:
+    """Drain queued records, stop the flusher and flush the log file."""
+    listener.stop()
+    _flush_stop.set()
+    file_handler.flush()
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """QueueHandler that hands records to the listener mostly unformatted.
+
+    The stock :meth:`QueueHandler.prepare` renders the message and drops
+    ``exc_info`` so records can cross a process boundary.  Our listener is a
+    thread in the same process, so the record keeps ``exc_info`` and the
+    listener's handlers apply :class:`_JsonFormatter` themselves.  Only the
+    caller-owned parts (``extra_data`` and any message args) are rendered
+    up front, since the caller may mutate or reuse them as soon as the log
+    call returns.
+
+    One instance is shared by every logger, so :meth:`handle` skips the
+    handler lock that :class:`logging.Handler` takes around ``emit``:
+    ``prepare`` only touches the record and ``SimpleQueue.put`` is
+    thread-safe, so logging threads never wait on each other here.
+
+    When the listener falls behind by ``_LOG_QUEUE_SIZE`` records, records
+    below ``_DROP_BELOW_LEVEL`` are dropped (and counted) so a flood of
+    DEBUG/INFO output cannot grow the queue without bound; warnings and
+    errors are always enqueued.  Once the backlog clears, a WARNING record
+    reporting how many records were dropped is queued ahead of the next
+    record.
+    """
+
+    def __init__(self, log_queue: "queue.SimpleQueue[logging.LogRecord]") -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._unreported_drops = 0
+        # Guards the drop counters only; taken on the drop and report paths.
+        self._drop_lock = threading.Lock()
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return bool(rv)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        extra_data = getattr(record, "extra_data", None)
+        if extra_data is not None:
+            record.extra_data_json = _JSON_ENCODER.encode(extra_data)
+            record.extra_data = None
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.queue.qsize() >= _LOG_QUEUE_SIZE:
+            if record.levelno < _DROP_BELOW_LEVEL:
+                with self._drop_lock:
+                    self.dropped += 1
+                    self._unreported_drops += 1
+                return
+        elif self._unreported_drops:
+            self._report_drops()
+        self.queue.put_nowait(record)
+
+    def _report_drops(self) -> None:
+        """Queue a WARNING record with the number of records dropped since
+        the last report."""
+        with self._drop_lock:
+            count, self._unreported_drops = self._unreported_drops, 0
+            total = self.dropped
+        if not count:
+            return
+        notice = logging.LogRecord(
+            "workbench.logger",
+            logging.WARNING,
+            "",
+            0,
+            f"Dropped {count} DEBUG/INFO log records while the log writer "
+            f"was behind",
+            None,
+            None,
+        )
+        notice.agent_name = "logger"
+        notice.trace_id = None
+        notice.extra_data_json = _JSON_ENCODER.encode(
+            {
+                "event_type": "log_records_dropped",
+                "dropped": count,
+                "total_dropped": total,
+            }
+        )
+        self.queue.put_nowait(notice)
+
+
+def _get_queue_handler() -> "_InProcessQueueHandler":
+    """Return the shared queue handler, starting the listener on first use."""
+    global _queue_handler, _listener
+    if _queue_handler is not None:
+        return _queue_handler
+    with _listener_lock:
+        if _queue_handler is None:
+            # Console handler (stderr so it does not interfere with stdout data)
+            console = logging.StreamHandler(sys.stderr)
+            console.setLevel(logging.INFO)
+            console.setFormatter(_JSON_FORMATTER)
+
+            # File handler
+            _ensure_logs_dir()
+            file_handler = _BufferedFileHandler(_LOG_FILE, encoding="utf-8")
+            file_handler.setLevel(logging.DEBUG)
+            file_handler.setFormatter(_JSON_FORMATTER)
+
+            # SimpleQueue's put is lock-free for producers; the size bound is
+            # enforced by _InProcessQueueHandler.enqueue.
+            log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+            _listener = QueueListener(
+                log_queue, console, file_handler, respect_handler_level=True
+            )
+            _listener.start()
+            threading.Thread(
+                target=_flush_periodically,
+                args=(file_handler,),
+                name="workbench-log-flush",
+                daemon=True,
+            ).start()
+            atexit.register(_shutdown, _listener, file_handler)
+            _queue_handler = _InProcessQueueHandler(log_queue)
+    return _queue_handler
+
+
+def dropped_record_count() -> int:
+    """Return how many DEBUG/INFO records were dropped because the background
+    writer fell behind."""
+    handler = _queue_handler
+    return handler.dropped if handler is not None else 0
 
 
 # ---------------------------------------------------------------------------
 # WorkbenchLogger
 # ---------------------------------------------------------------------------
 
+def _level_method(level: int, name: str):
+    """Build a :class:`WorkbenchLogger` method that logs at a fixed *level*.
+
+    Each level method carries the full logging body with its level bound in
+    the closure, rather than trampolining through a shared ``_log(level,
+    ...)`` helper, so a call costs one Python frame instead of two.
+    """
+
+    def method(
+        self: "WorkbenchLogger",
+        message: str,
+        agent_name: Optional[str] = None,
+        trace_id: Optional[str] = None,
+        extra_data: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        logger = self._logger
+        if not logger.isEnabledFor(level):
+            return
+        # Build the record directly and set the structured fields on it,
+        # rather than going through Logger.log(extra=...), which allocates an
+        # extra dict and walks the stack for caller info we never emit.
+        record = logger.makeRecord(logger.name, level, "", 0, message, None, None)
+        record.agent_name = agent_name or self._name
+        record.trace_id = trace_id
+        record.extra_data = extra_data
+        logger.handle(record)
+
+    method.__name__ = name
+    method.__qualname__ = f"WorkbenchLogger.{name}"
+    method.__doc__ = f"Log *message* at {logging.getLevelName(level)} level."
+    return method
+
+
 class WorkbenchLogger:
     """Thin wrapper around :class:`logging.Logger` that injects structured
     fields (trace_id, agent_name, extra_data) into every log record.
@@ -106,21 +396,9 @@ class WorkbenchLogger:
     # -- handler setup ------------------------------------------------------
 
     def _attach_handlers(self) -> None:
-        json_fmt = _JsonFormatter()
-
-        # Console handler (stderr so it does not interfere with stdout data)
-        console = logging.StreamHandler(sys.stderr)
-        console.setLevel(logging.INFO)
-        console.setFormatter(json_fmt)
-        self._logger.addHandler(console)
-
-        # File handler
-        logs_dir = _ensure_logs_dir()
-        log_file = logs_dir / "workbench.log"
-        file_handler = logging.FileHandler(str(log_file), encoding="utf-8")
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(json_fmt)
-        self._logger.addHandler(file_handler)
+        # Only the cheap enqueue happens on the caller's thread; the shared
+        # listener does the formatting and writing.
+        self._logger.addHandler(_get_queue_handler())
 
     # -- public API ---------------------------------------------------------
 
@@ -128,65 +406,15 @@ class WorkbenchLogger:
     def name(self) -> str:
         return self._name
 
-    def _log(
-        self,
-        level: int,
-        message: str,
-        agent_name: Optional[str] = None,
-        trace_id: Optional[str] = None,
-        extra_data: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        extra = {
-            "agent_name": agent_name or self._name,
-            "trace_id": trace_id,
-            "extra_data": extra_data,
-        }
-        self._logger.log(level, message, extra=extra)
-
-    def debug(
-        self,
-        message: str,
-        agent_name: Optional[str] = None,
-        trace_id: Optional[str] = None,
-        extra_data: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        self._log(logging.DEBUG, message, agent_name, trace_id, extra_data)
+    def isEnabledFor(self, level: int) -> bool:
+        """Return True if a record at *level* would be processed."""
+        return self._logger.isEnabledFor(level)
 
-    def info(
-        self,
-        message: str,
-        agent_name: Optional[str] = None,
-        trace_id: Optional[str] = None,
-        extra_data: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        self._log(logging.INFO, message, agent_name, trace_id, extra_data)
-
-    def warning(
-        self,
-        message: str,
-        agent_name: Optional[str] = None,
-        trace_id: Optional[str] = None,
-        extra_data: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        self._log(logging.WARNING, message, agent_name, trace_id, extra_data)
-
-    def error(
-        self,
-        message: str,
-        agent_name: Optional[str] = None,
-        trace_id: Optional[str] = None,
-        extra_data: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        self._log(logging.ERROR, message, agent_name, trace_id, extra_data)
-
-    def critical(
-        self,
-        message: str,
-        agent_name: Optional[str] = None,
-        trace_id: Optional[str] = None,
-        extra_data: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        self._log(logging.CRITICAL, message, agent_name, trace_id, extra_data)
+    debug = _level_method(logging.DEBUG, "debug")
+    info = _level_method(logging.INFO, "info")
+    warning = _level_method(logging.WARNING, "warning")
+    error = _level_method(logging.ERROR, "error")
+    critical = _level_method(logging.CRITICAL, "critical")
 
 
 # ---------------------------------------------------------------------------
@@ -207,13 +435,29 @@ def get_logger(name: str) -> WorkbenchLogger:
         Logical name for the logger, typically the agent or subsystem name
         (e.g. ``"pm_agent"``, ``"orchestrator"``).
     """
-    if name in _loggers:
-        return _loggers[name]
+    logger = _loggers.get(name)
+    if logger is not None:
+        return logger
     with _logger_lock:
         # Double-check after acquiring lock
-        if name not in _loggers:
-            _loggers[name] = WorkbenchLogger(name)
-        return _loggers[name]
+        logger = _loggers.get(name)
+        if logger is None:
+            logger = _loggers[name] = WorkbenchLogger(name)
+        return logger
+
+
+_RESULT_SUMMARY_CHARS = 500
+
+
+def _result_summary(result: Any) -> str:
+    """Return ``str(result)[:500]``, slicing strings before converting them.
+
+    Tool results that are already strings can be arbitrarily long; slicing
+    first avoids copying the whole payload just to keep its head.
+    """
+    if isinstance(result, str):
+        return str(result[:_RESULT_SUMMARY_CHARS])
+    return str(result)[:_RESULT_SUMMARY_CHARS]
 
 
 def log_tool_call(
@@ -242,6 +486,9 @@ def log_tool_call(
         Optional correlation id linking this call to a broader trace.
     """
     logger = get_logger(agent_name)
+    # Skip stringifying the result when INFO is disabled.
+    if not logger.isEnabledFor(logging.INFO):
+        return
     logger.info(
         f"Tool call: {tool_name}",
         agent_name=agent_name,
@@ -250,7 +497,7 @@ def log_tool_call(
             "event_type": "tool_call",
             "tool_name": tool_name,
             "params": params,
-            "result_summary": str(result)[:500],
+            "result_summary": _result_summary(result),
             "latency_ms": round(latency_ms, 2),
         },
     )
@@ -277,6 +524,8 @@ def log_agent_event(
         Optional correlation id.
     """
     logger = get_logger(agent_name)
+    if not logger.isEnabledFor(logging.INFO):
+        return
     logger.info(
         f"Agent event: {event_type}",
         agent_name=agent_name,
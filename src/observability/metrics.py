@@ -20,18 +20,118 @@ Usage:
 """
 
 import json
+import random
 import threading
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+# Per-thread tool-call buffers are merged into the shared aggregates once
+# they hold this many samples or have been pending this long.
+_BUFFER_FLUSH_COUNT = 64
+_BUFFER_FLUSH_INTERVAL_S = 0.25
+
+
+# Number of lock shards; each agent's metrics are guarded by one shard.
+_LOCK_SHARDS = 16
+
+# Number of most recent error messages kept (and reported) per agent.
+_RECENT_ERRORS = 10
+
+# Latency distributions keep at most this many samples each.
+_RESERVOIR_SIZE = 1024
+
+_reservoir_rng = random.Random()
+
+
+class _RunningStats:
+    """Exact count / sum / min / max of a stream of floats in O(1) memory.
+
+    Not thread-safe; callers hold the collector lock.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count
+
+
+class _Reservoir(_RunningStats):
+    """Running stats plus a fixed-size uniform random sample for percentiles.
+
+    Uses Vitter's Algorithm R: the first ``size`` values are stored as-is,
+    after which the n-th value replaces a random slot with probability
+    ``size / n``.  Memory stays constant however long the session runs,
+    while min / max / mean remain exact.
+    """
+
+    def __init__(self, size: int = _RESERVOIR_SIZE) -> None:
+        super().__init__()
+        self._samples = np.empty(size, dtype=np.float64)
+
+    def add(self, value: float) -> None:
+        n = self.count
+        size = self._samples.shape[0]
+        if n < size:
+            self._samples[n] = value
+        else:
+            j = _reservoir_rng.randrange(n + 1)
+            if j < size:
+                self._samples[j] = value
+        super().add(value)
+
+    def extend(self, values: List[float]) -> None:
+        for value in values:
+            self.add(value)
+
+    def view(self) -> np.ndarray:
+        """Return the retained samples (a view, not a copy)."""
+        return self._samples[: min(self.count, self._samples.shape[0])]
+
+
+class _ToolCallBuffer:
+    """Per-thread staging area for tool-call latencies.
+
+    Only the owning thread appends to it; :class:`MetricsCollector` drains
+    it into the shared aggregates.  ``lock`` is uncontended except while a
+    reader is draining every thread's buffer.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # latencies[(agent, tool)] = [float, ...]
+        self.latencies: Dict[Tuple[str, str], List[float]] = {}
+        self.pending = 0
+        self.last_flush = time.monotonic()
+        self.thread = threading.current_thread()
 
 
 class MetricsCollector:
     """Singleton metrics collector for workbench telemetry.
 
-    All public methods are thread-safe.  The singleton is implemented via
+    All public methods are thread-safe.  Recorders lock only the shard that
+    owns their agent (``hash(agent) % _LOCK_SHARDS``), so different agents
+    rarely contend; readers take every shard.  An agent's entries are only
+    ever written under its own shard, and single dict operations are atomic,
+    so the shared dicts stay consistent.  The singleton is implemented via
     ``__new__`` so that ``MetricsCollector()`` always returns the same
     instance regardless of where it is imported or instantiated.
     """
@@ -56,33 +156,44 @@ class MetricsCollector:
         with MetricsCollector._init_lock:
             if MetricsCollector._initialized:
                 return
+            self._shards = tuple(threading.Lock() for _ in range(_LOCK_SHARDS))
+            # Guards the _buffers registry only.
             self._lock = threading.Lock()
+            self._tls = threading.local()
+            # Every live thread's _ToolCallBuffer, so readers can drain them.
+            self._buffers: List[_ToolCallBuffer] = []
             self._start_time = time.monotonic()
             self._start_utc = datetime.now(timezone.utc).isoformat()
 
             # --- counters / accumulators ---
-            # tool_call_count[agent][tool] = int
-            self._tool_call_count: Dict[str, Dict[str, int]] = defaultdict(
-                lambda: defaultdict(int)
-            )
-            # tool_call_latency[agent][tool] = [float, ...]
-            self._tool_call_latency: Dict[str, Dict[str, List[float]]] = defaultdict(
-                lambda: defaultdict(list)
-            )
-            # agent_execution_time[agent] = [float, ...]
-            self._agent_execution_time: Dict[str, List[float]] = defaultdict(list)
+            # Keyed by flat (agent, name) tuples: one hash probe per update,
+            # grouped by agent only when a summary is built.
+            # tool_call_count[(agent, tool)] = int
+            self._tool_call_count: Dict[Tuple[str, str], int] = {}
+            # tool_call_latency[(agent, tool)] = _Reservoir
+            self._tool_call_latency: Dict[Tuple[str, str], _Reservoir] = {}
+            # agent_execution_time[agent] = _Reservoir
+            self._agent_execution_time: Dict[str, _Reservoir] = defaultdict(_Reservoir)
             # llm_token_usage[agent] = {"input": int, "output": int}
             self._llm_token_usage: Dict[str, Dict[str, int]] = defaultdict(
                 lambda: {"input": 0, "output": 0}
             )
-            # error_count[agent][error_type] = int
-            self._error_count: Dict[str, Dict[str, int]] = defaultdict(
-                lambda: defaultdict(int)
+            # error_count[(agent, error_type)] = int
+            self._error_count: Dict[Tuple[str, str], int] = {}
+            # error_messages[agent] = deque of the last _RECENT_ERRORS
+            # (error_type, message, epoch_seconds) tuples
+            self._error_messages: Dict[str, Deque[tuple]] = defaultdict(
+                lambda: deque(maxlen=_RECENT_ERRORS)
             )
-            # error_messages[agent] = [(error_type, message, iso_timestamp), ...]
-            self._error_messages: Dict[str, List[tuple]] = defaultdict(list)
-            # confidence_scores[agent] = [float, ...]
-            self._confidence_scores: Dict[str, List[float]] = defaultdict(list)
+            # confidence_scores[agent] = _RunningStats
+            self._confidence_scores: Dict[str, _RunningStats] = defaultdict(
+                _RunningStats
+            )
+
+            # Last snapshot built by get_summary(); _dirty is set by every
+            # recorder and cleared when the snapshot is rebuilt.
+            self._cached_summary: Optional[Dict[str, Any]] = None
+            self._dirty = True
 
             MetricsCollector._initialized = True
 
@@ -102,9 +213,18 @@ class MetricsCollector:
         latency_ms:
             Elapsed wall-clock time in milliseconds.
         """
-        with self._lock:
-            self._tool_call_count[agent][tool] += 1
-            self._tool_call_latency[agent][tool].append(latency_ms)
+        buf = self._thread_buffer()
+        with buf.lock:
+            samples = buf.latencies.get((agent, tool))
+            if samples is None:
+                samples = buf.latencies[(agent, tool)] = []
+            samples.append(latency_ms)
+            buf.pending += 1
+            if (
+                buf.pending >= _BUFFER_FLUSH_COUNT
+                or time.monotonic() - buf.last_flush >= _BUFFER_FLUSH_INTERVAL_S
+            ):
+                self._merge_buffer(buf)
 
     def record_agent_execution(
         self,
@@ -126,8 +246,9 @@ class MetricsCollector:
         token_output:
             Number of output (completion) tokens generated.
         """
-        with self._lock:
-            self._agent_execution_time[agent].append(duration_ms)
+        with self._shard(agent):
+            self._dirty = True
+            self._agent_execution_time[agent].add(duration_ms)
             self._llm_token_usage[agent]["input"] += token_input
             self._llm_token_usage[agent]["output"] += token_output
 
@@ -145,9 +266,12 @@ class MetricsCollector:
         message:
             Human-readable description of the error.
         """
-        ts = datetime.now(timezone.utc).isoformat()
-        with self._lock:
-            self._error_count[agent][error_type] += 1
+        # Stored as a raw epoch float; formatted only if it is reported.
+        ts = time.time()
+        with self._shard(agent):
+            self._dirty = True
+            key = (agent, error_type)
+            self._error_count[key] = self._error_count.get(key, 0) + 1
             self._error_messages[agent].append((error_type, message, ts))
 
     def record_confidence(self, agent: str, score: float) -> None:
@@ -160,8 +284,78 @@ class MetricsCollector:
         score:
             Confidence value, typically in ``[0, 1]``.
         """
+        with self._shard(agent):
+            self._dirty = True
+            self._confidence_scores[agent].add(score)
+
+    # -- locking ------------------------------------------------------------
+
+    def _shard(self, agent: str) -> threading.Lock:
+        """Return the lock guarding *agent*'s metrics."""
+        return self._shards[hash(agent) % _LOCK_SHARDS]
+
+    @contextmanager
+    def _all_shards(self) -> Iterator[None]:
+        """Hold every shard lock, acquired in a fixed order."""
+        for lock in self._shards:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(self._shards):
+                lock.release()
+
+    # -- per-thread buffering -----------------------------------------------
+
+    def _thread_buffer(self) -> _ToolCallBuffer:
+        """Return the calling thread's tool-call buffer, creating it if needed."""
+        buf = getattr(self._tls, "buffer", None)
+        if buf is None:
+            buf = self._tls.buffer = _ToolCallBuffer()
+            with self._lock:
+                self._buffers.append(buf)
+        return buf
+
+    def _merge_buffer(self, buf: _ToolCallBuffer) -> None:
+        """Move *buf*'s samples into the shared aggregates.
+
+        Caller must hold ``buf.lock``; each entry is merged under its
+        agent's shard lock.
+        """
+        counts = self._tool_call_count
+        for key, samples in buf.latencies.items():
+            with self._shard(key[0]):
+                counts[key] = counts.get(key, 0) + len(samples)
+                reservoir = self._tool_call_latency.get(key)
+                if reservoir is None:
+                    reservoir = self._tool_call_latency[key] = _Reservoir()
+                reservoir.extend(samples)
+                self._dirty = True
+        buf.latencies.clear()
+        buf.pending = 0
+        buf.last_flush = time.monotonic()
+
+    def _drain_buffers(self, discard: bool = False) -> None:
+        """Merge (or, with *discard*, drop) every thread's pending samples.
+
+        Buffers belonging to threads that have exited are unregistered once
+        drained.
+        """
         with self._lock:
-            self._confidence_scores[agent].append(score)
+            buffers = list(self._buffers)
+        dead = []
+        for buf in buffers:
+            with buf.lock:
+                if discard:
+                    buf.latencies.clear()
+                    buf.pending = 0
+                elif buf.pending:
+                    self._merge_buffer(buf)
+            if not buf.thread.is_alive():
+                dead.append(buf)
+        if dead:
+            with self._lock:
+                self._buffers = [b for b in self._buffers if b not in dead]
 
     # -- query methods ------------------------------------------------------
 
@@ -169,44 +363,55 @@ class MetricsCollector:
         """Return a snapshot of all collected metrics as a plain dict.
 
         The returned dictionary is a deep copy; mutating it has no effect
-        on the collector's internal state.
+        on the collector's internal state.  The snapshot is rebuilt only
+        when something has been recorded since the previous call.
         """
-        with self._lock:
-            return self._build_summary()
+        self._drain_buffers()
+        with self._all_shards():
+            if self._dirty or self._cached_summary is None:
+                self._cached_summary = self._build_summary()
+                self._dirty = False
+            summary = _copy_summary(self._cached_summary)
+            summary["elapsed_seconds"] = round(time.monotonic() - self._start_time, 2)
+        return summary
 
     def _build_summary(self) -> Dict[str, Any]:
-        """Internal helper (caller must hold ``self._lock``)."""
+        """Internal helper (caller must hold every shard lock)."""
         elapsed_s = time.monotonic() - self._start_time
 
         # --- tool calls ---
         tool_calls: Dict[str, Any] = {}
-        for agent, tools in self._tool_call_count.items():
-            tool_calls[agent] = {}
-            for tool, count in tools.items():
-                latencies = self._tool_call_latency[agent][tool]
-                tool_calls[agent][tool] = {
-                    "count": count,
-                    "latency_ms": _latency_stats(latencies),
-                }
+        for (agent, tool), count in self._tool_call_count.items():
+            tool_calls.setdefault(agent, {})[tool] = {
+                "count": count,
+                "latency_ms": _latency_stats(self._tool_call_latency[(agent, tool)]),
+            }
 
         # --- agent execution ---
         agent_exec: Dict[str, Any] = {}
         for agent, durations in self._agent_execution_time.items():
             agent_exec[agent] = {
-                "invocations": len(durations),
+                "invocations": durations.count,
                 "duration_ms": _latency_stats(durations),
                 "tokens": dict(self._llm_token_usage.get(agent, {"input": 0, "output": 0})),
             }
 
         # --- errors ---
+        errors_by_type: Dict[str, Dict[str, int]] = {}
+        for (agent, error_type), count in self._error_count.items():
+            errors_by_type.setdefault(agent, {})[error_type] = count
         errors: Dict[str, Any] = {}
-        for agent, types in self._error_count.items():
+        for agent, types in errors_by_type.items():
             errors[agent] = {
-                "by_type": dict(types),
+                "by_type": types,
                 "total": sum(types.values()),
                 "recent": [
-                    {"type": t, "message": m, "timestamp": ts}
-                    for t, m, ts in self._error_messages[agent][-10:]
+                    {
+                        "type": t,
+                        "message": m,
+                        "timestamp": datetime.fromtimestamp(ts, timezone.utc).isoformat(),
+                    }
+                    for t, m, ts in self._error_messages[agent]
                 ],
             }
 
@@ -214,10 +419,10 @@ class MetricsCollector:
         confidence: Dict[str, Any] = {}
         for agent, scores in self._confidence_scores.items():
             confidence[agent] = {
-                "count": len(scores),
-                "mean": round(sum(scores) / len(scores), 4) if scores else None,
-                "min": round(min(scores), 4) if scores else None,
-                "max": round(max(scores), 4) if scores else None,
+                "count": scores.count,
+                "mean": round(scores.mean, 4) if scores.count else None,
+                "min": round(scores.min, 4) if scores.count else None,
+                "max": round(scores.max, 4) if scores.count else None,
             }
 
         return {
@@ -253,7 +458,8 @@ class MetricsCollector:
 
     def reset(self) -> None:
         """Clear all accumulated metrics.  Useful in tests."""
-        with self._lock:
+        self._drain_buffers(discard=True)
+        with self._all_shards():
             self._start_time = time.monotonic()
             self._start_utc = datetime.now(timezone.utc).isoformat()
             self._tool_call_count.clear()
@@ -263,32 +469,65 @@ class MetricsCollector:
             self._error_count.clear()
             self._error_messages.clear()
             self._confidence_scores.clear()
+            self._cached_summary = None
 
 
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-def _latency_stats(values: List[float]) -> Dict[str, Any]:
-    """Compute min / max / mean / p50 / p95 / p99 for a list of latencies."""
-    if not values:
+def _copy_summary(value: Any) -> Any:
+    """Deep-copy a summary tree of dicts, lists and scalars.
+
+    Several times cheaper than ``copy.deepcopy``, which the summary's plain
+    structure does not need.
+    """
+    if isinstance(value, dict):
+        return {k: _copy_summary(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_summary(v) for v in value]
+    return value
+
+
+_PERCENTILES = (50, 95, 99)
+
+# Below this many samples a full sort beats np.partition's setup cost.
+_PARTITION_MIN_SAMPLES = 32
+
+
+def _latency_stats(reservoir: _Reservoir) -> Dict[str, Any]:
+    """Compute min / max / mean (exact) and p50 / p95 / p99 (sampled)."""
+    if not reservoir.count:
         return {"min": None, "max": None, "mean": None, "p50": None, "p95": None, "p99": None}
 
-    sorted_v = sorted(values)
-    n = len(sorted_v)
+    values = reservoir.view()
+    n = values.shape[0]
 
-    def _percentile(p: float) -> float:
+    # (lo, hi, frac) interpolation points for each percentile.
+    points = []
+    for p in _PERCENTILES:
         idx = (p / 100.0) * (n - 1)
         lo = int(idx)
-        hi = min(lo + 1, n - 1)
-        frac = idx - lo
-        return round(sorted_v[lo] * (1 - frac) + sorted_v[hi] * frac, 2)
+        points.append((lo, min(lo + 1, n - 1), idx - lo))
+
+    # Only the order statistics at these ranks are needed, so partition
+    # around them (O(n) introselect) instead of sorting the whole sample.
+    # Tiny samples are cheaper to sort outright.
+    if n < _PARTITION_MIN_SAMPLES:
+        ranked = np.sort(values)
+    else:
+        ranked = np.partition(values, sorted({r for lo, hi, _ in points for r in (lo, hi)}))
+
+    p50, p95, p99 = (
+        round(float(ranked[lo] * (1 - frac) + ranked[hi] * frac), 2)
+        for lo, hi, frac in points
+    )
 
     return {
-        "min": round(min(sorted_v), 2),
-        "max": round(max(sorted_v), 2),
-        "mean": round(sum(sorted_v) / n, 2),
-        "p50": _percentile(50),
-        "p95": _percentile(95),
-        "p99": _percentile(99),
+        "min": round(reservoir.min, 2),
+        "max": round(reservoir.max, 2),
+        "mean": round(reservoir.mean, 2),
+        "p50": p50,
+        "p95": p95,
+        "p99": p99,
     }
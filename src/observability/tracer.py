@@ -2,8 +2,9 @@
 Distributed-style trace correlation for the Program Execution Workbench.
 
 Provides :class:`TraceContext` value objects, a :class:`Tracer` that manages
-the lifecycle of traces and spans, and an :class:`ExecutionReport` that
-renders a human-readable summary of a completed trace.
+the lifecycle of traces and spans (and a no-op :class:`NullTracer` for when
+tracing is disabled), and an :class:`ExecutionReport` that renders a
+human-readable summary of a completed trace.
 
 A *trace* represents the full lifecycle of a user intent flowing through the
 multi-agent pipeline.  Each agent or sub-operation creates a *span* within
@@ -27,46 +28,120 @@ Usage:
     report = ExecutionReport(tracer.get_trace(trace_id))
     print(report.render())
     tracer.export_trace(trace_id, "traces/my_trace.json")
+    tracer.flush()   # wait for background exports to reach disk
 """
 
+import atexit
 import json
+import logging
+import os
+import queue
+import sys
 import threading
 import time
-import uuid
-from dataclasses import dataclass, field, asdict
+import weakref
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# ---------------------------------------------------------------------------
+# ID generation
+#
+# Trace and span IDs are 32 hex characters of randomness (the same shape as
+# ``uuid.uuid4().hex``).  Each thread slices them out of a pre-fetched block
+# of os.urandom() bytes, avoiding a syscall and a UUID object per ID.
+# ---------------------------------------------------------------------------
+
+_ID_BYTES = 16
+_ID_POOL_BYTES = 4096
+
+_id_pool = threading.local()
+
+
+def _reset_id_pool() -> None:
+    """Give a forked child its own pool so it cannot repeat the parent's IDs."""
+    global _id_pool
+    _id_pool = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_id_pool)
+
+
+def _new_id() -> str:
+    """Return a random 128-bit identifier as 32 lowercase hex characters."""
+    pool = _id_pool
+    try:
+        buf, pos = pool.buf, pool.pos
+    except AttributeError:
+        buf, pos = b"", 0
+    if pos >= len(buf):
+        buf = pool.buf = os.urandom(_ID_POOL_BYTES)
+        pos = 0
+    pool.pos = pos + _ID_BYTES
+    return buf[pos:pos + _ID_BYTES].hex()
+
+
+# ---------------------------------------------------------------------------
+# Timestamps
+#
+# Span and trace times are stored as raw ``time.perf_counter_ns()``
+# readings, one clock read per event (the highest-resolution monotonic
+# clock on every platform).  They are converted to ISO-8601 wall-clock
+# strings only when a trace is serialised, by offsetting from a
+# wall/perf-counter anchor pair captured at import.
+# ---------------------------------------------------------------------------
+
+_WALL_ANCHOR_NS = time.time_ns()
+_MONO_ANCHOR_NS = time.perf_counter_ns()
+
+
+def _iso_from_mono(mono_ns: Optional[int]) -> Optional[str]:
+    """Convert a ``time.perf_counter_ns()`` reading to an ISO-8601 UTC string."""
+    if mono_ns is None:
+        return None
+    wall_ns = _WALL_ANCHOR_NS + (mono_ns - _MONO_ANCHOR_NS)
+    return datetime.fromtimestamp(wall_ns / 1e9, timezone.utc).isoformat()
+
+
+def _elapsed_ms(start_ns: int, end_ns: int) -> float:
+    """Milliseconds between two ``perf_counter_ns`` readings, to 2 places."""
+    return round((end_ns - start_ns) / 1e6, 2)
 
 
 # ---------------------------------------------------------------------------
 # TraceContext – immutable-ish value object for a single span
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class TraceContext:
     """Represents a single span within a trace.
 
     Attributes
     ----------
     trace_id : str
-        UUID identifying the overall trace.
+        Random 32-hex-character ID of the overall trace.
     span_id : str
-        UUID identifying this particular span.
+        Random 32-hex-character ID of this particular span.
     parent_span_id : str or None
         The span that spawned this one (``None`` for root spans).
     agent_name : str
         Agent or subsystem that owns this span.
     operation : str
         Short label describing the operation (e.g. ``"risk_assessment"``).
-    start_time : str
-        ISO-8601 timestamp when the span was opened.
-    end_time : str or None
-        ISO-8601 timestamp when the span was closed.
+    start_time : int
+        ``time.perf_counter_ns()`` reading when the span was opened; exported
+        as an ISO-8601 timestamp.
+    end_time : int or None
+        ``time.perf_counter_ns()`` reading when the span was closed; exported
+        as an ISO-8601 timestamp.
     status : str
         Terminal status such as ``"ok"``, ``"error"``, ``"timeout"``.
-    metadata : dict
-        Arbitrary key-value payload attached at span close.
+    metadata : dict or None
+        Arbitrary key-value payload attached at span close (``None`` while
+        the span is open; exported as ``{}``).
     """
 
     trace_id: str
@@ -74,76 +149,141 @@ class TraceContext:
     parent_span_id: Optional[str]
     agent_name: str
     operation: str
-    start_time: str
-    end_time: Optional[str] = None
+    start_time: int
+    end_time: Optional[int] = None
     status: str = "in_progress"
-    metadata: Dict[str, Any] = field(default_factory=dict)
-    _mono_start: float = field(default=0.0, repr=False)
+    metadata: Optional[Dict[str, Any]] = None
 
     def duration_ms(self) -> Optional[float]:
         """Return wall-clock duration in milliseconds, or ``None`` if the
         span has not yet been closed."""
-        if self.end_time is None:
+        if self.end_time is None or not self.metadata:
             return None
-        # We stash the monotonic start in _mono_start and compute duration
-        # via the monotonic delta recorded at close time.
+        # Tracer.end_span records the duration alongside the metadata.
         return self.metadata.get("_duration_ms")
 
     def to_dict(self) -> Dict[str, Any]:
-        """Serialise to a plain dict (excludes private fields)."""
-        d = asdict(self)
-        d.pop("_mono_start", None)
-        d["duration_ms"] = self.duration_ms()
-        return d
+        """Serialise to a plain dict with ISO-8601 timestamps.
+
+        ``metadata`` is copied one level deep; its values are shared with
+        the span, which is never mutated after it is closed.
+        """
+        metadata = self.metadata
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "agent_name": self.agent_name,
+            "operation": self.operation,
+            "start_time": _iso_from_mono(self.start_time),
+            "end_time": _iso_from_mono(self.end_time),
+            "status": self.status,
+            "metadata": dict(metadata) if metadata else {},
+            "duration_ms": self.duration_ms(),
+        }
 
 
 # ---------------------------------------------------------------------------
 # Trace – container for all spans belonging to one trace
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class _Trace:
     """Internal container grouping spans under a single trace_id."""
 
     trace_id: str
     intent: str
-    start_time: str
-    end_time: Optional[str] = None
+    start_time: int
+    end_time: Optional[int] = None
     status: str = "in_progress"
     spans: Dict[str, TraceContext] = field(default_factory=dict)
-    _mono_start: float = field(default=0.0, repr=False)
+    # Set by Tracer.end_trace.
+    _duration_ms: Optional[float] = field(default=None, repr=False)
+    # Guards this trace's mutable state (spans, end_time, status).
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
 
-    def duration_ms(self) -> Optional[float]:
-        if self.end_time is None:
-            return None
-        return self.spans.get("__trace_duration_ms__", None) or None
 
-    def to_dict(self) -> Dict[str, Any]:
-        duration = None
-        if "__trace_duration_ms__" in self.spans:
-            # stored as a sentinel; pop it for export
-            pass
-        span_list = []
-        for sid, ctx in self.spans.items():
-            if sid.startswith("__"):
+# A span as captured by Tracer.get_trace: the context plus the fields that
+# end_span mutates (end_time, status, metadata), read under the trace lock.
+_SpanSnapshot = Tuple[
+    TraceContext, Optional[int], str, Optional[Dict[str, Any]]
+]
+
+
+# ---------------------------------------------------------------------------
+# Background export writer
+# ---------------------------------------------------------------------------
+
+class _ExportWriter:
+    """Single background thread that encodes and writes exported traces.
+
+    Shared by every :class:`Tracer` so exports never block the calling agent
+    on JSON encoding or file I/O.  An error raised while writing is handed
+    back to the tracer that submitted the export and re-raised by that
+    tracer's :meth:`Tracer.flush`; errors nobody flushed are logged at exit.
+    """
+
+    def __init__(self) -> None:
+        self._queue: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
+        self._start_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        # Tracers holding a write error, for the atexit hook.
+        self._failed: "weakref.WeakSet[Tracer]" = weakref.WeakSet()
+
+    def submit(self, data: Dict[str, Any], dest: str, owner: "Tracer") -> None:
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    thread = threading.Thread(
+                        target=self._run, name="trace-export-writer", daemon=True
+                    )
+                    thread.start()
+                    # Finish queued exports before the interpreter exits.
+                    atexit.register(self._flush_at_exit)
+                    self._thread = thread
+        self._queue.put((data, dest, owner, None))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every export submitted so far has been written.
+
+        Returns ``False`` if *timeout* expired first.
+        """
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        self._queue.put((None, None, None, done))
+        return done.wait(timeout)
+
+    def _flush_at_exit(self) -> None:
+        """atexit hook: flush, then log (not raise) any unflushed write error."""
+        self.flush()
+        # Plain stdlib logging: the workbench log listener may already have
+        # been shut down by its own atexit hook.
+        log = logging.getLogger(__name__)
+        for owner in list(self._failed):
+            for exc in owner._take_export_errors():
+                log.error("Trace export failed", exc_info=exc)
+
+    def _run(self) -> None:
+        while True:
+            data, dest, owner, done = self._queue.get()
+            if done is not None:
+                done.set()
                 continue
-            span_list.append(ctx.to_dict())
+            try:
+                # Encode in one shot and write once; json.dump() would issue
+                # a write() per encoded fragment.
+                payload = json.dumps(data, indent=2, default=str)
+                with open(dest, "w", encoding="utf-8") as fh:
+                    fh.write(payload)
+            except Exception as exc:  # surfaced by owner.flush()
+                owner._export_errors.append(exc)
+                self._failed.add(owner)
 
-        return {
-            "trace_id": self.trace_id,
-            "intent": self.intent,
-            "start_time": self.start_time,
-            "end_time": self.end_time,
-            "status": self.status,
-            "duration_ms": self._compute_duration(),
-            "spans": span_list,
-        }
 
-    def _compute_duration(self) -> Optional[float]:
-        if self.end_time is None:
-            return None
-        # Use metadata stashed by Tracer.end_trace
-        return self.status  # placeholder replaced below
+_export_writer = _ExportWriter()
 
 
 # ---------------------------------------------------------------------------
@@ -154,15 +294,23 @@ class Tracer:
     """Thread-safe trace manager.
 
     Each call to :meth:`start_trace` creates a new trace (identified by a
-    UUID).  Spans are added within a trace via :meth:`start_span` and
+    random 128-bit hex ID).  Spans are added within a trace via :meth:`start_span` and
     closed with :meth:`end_span`.  When all work is done, call
     :meth:`end_trace` to finalise.
+
+    Span contexts live only in their trace; ``_span_to_trace`` maps each
+    open span ID back to its trace so :meth:`end_span` can find it.  The
+    ``_traces`` and ``_span_to_trace`` registries are only ever touched
+    with single ``dict`` get/set/pop operations, which are atomic, so they
+    need no lock.  Each trace carries its own lock for span and status mutations,
+    so agents working on different traces never contend.
     """
 
     def __init__(self) -> None:
-        self._lock = threading.Lock()
         self._traces: Dict[str, _Trace] = {}
-        self._spans: Dict[str, TraceContext] = {}
+        self._span_to_trace: Dict[str, str] = {}
+        # Appended to by the export writer thread; drained by flush().
+        self._export_errors: List[BaseException] = []
 
     # -- trace lifecycle ----------------------------------------------------
 
@@ -174,19 +322,14 @@ class Tracer:
         intent:
             Free-text description of the user intent driving this trace.
         """
-        trace_id = uuid.uuid4().hex
-        now_iso = datetime.now(timezone.utc).isoformat()
-        mono = time.monotonic()
-
+        trace_id = _new_id()
         trace = _Trace(
             trace_id=trace_id,
             intent=intent,
-            start_time=now_iso,
-            _mono_start=mono,
+            start_time=time.perf_counter_ns(),
         )
 
-        with self._lock:
-            self._traces[trace_id] = trace
+        self._traces[trace_id] = trace
 
         return trace_id
 
@@ -200,16 +343,36 @@ class Tracer:
         status:
             Terminal status label (e.g. ``"completed"``, ``"error"``).
         """
-        now_iso = datetime.now(timezone.utc).isoformat()
-        mono = time.monotonic()
-
-        with self._lock:
-            trace = self._traces.get(trace_id)
-            if trace is None:
-                raise ValueError(f"Unknown trace_id: {trace_id}")
-            trace.end_time = now_iso
+        now = time.perf_counter_ns()
+
+        trace = self._traces.get(trace_id)
+        if trace is None:
+            raise ValueError(f"Unknown trace_id: {trace_id}")
+        with trace._lock:
+            trace.end_time = now
             trace.status = status
-            trace._duration_ms = round((mono - trace._mono_start) * 1000, 2)
+            trace._duration_ms = _elapsed_ms(trace.start_time, now)
+
+    def complete_trace(self, trace_id: str) -> None:
+        """Release the span lookup entries of a finished trace.
+
+        The trace and its spans stay available to :meth:`get_trace` and
+        :meth:`export_trace`, but its spans can no longer be passed to
+        :meth:`end_span`.  Call this once no more spans will be closed.
+
+        Parameters
+        ----------
+        trace_id:
+            The trace whose span IDs should be forgotten.
+        """
+        trace = self._traces.get(trace_id)
+        if trace is None:
+            raise ValueError(f"Unknown trace_id: {trace_id}")
+        with trace._lock:
+            span_ids = list(trace.spans)
+        pop = self._span_to_trace.pop
+        for span_id in span_ids:
+            pop(span_id, None)
 
     # -- span lifecycle -----------------------------------------------------
 
@@ -233,26 +396,24 @@ class Tracer:
         parent_span_id:
             Optional parent span for nesting.
         """
-        span_id = uuid.uuid4().hex
-        now_iso = datetime.now(timezone.utc).isoformat()
-        mono = time.monotonic()
-
+        span_id = _new_id()
+        # Labels repeat across spans: interning keeps one copy of each and
+        # lets equality checks and set/dict lookups short-circuit on identity.
         ctx = TraceContext(
             trace_id=trace_id,
             span_id=span_id,
             parent_span_id=parent_span_id,
-            agent_name=agent_name,
-            operation=operation,
-            start_time=now_iso,
-            _mono_start=mono,
+            agent_name=sys.intern(agent_name),
+            operation=sys.intern(operation),
+            start_time=time.perf_counter_ns(),
         )
 
-        with self._lock:
-            trace = self._traces.get(trace_id)
-            if trace is None:
-                raise ValueError(f"Unknown trace_id: {trace_id}")
+        trace = self._traces.get(trace_id)
+        if trace is None:
+            raise ValueError(f"Unknown trace_id: {trace_id}")
+        with trace._lock:
             trace.spans[span_id] = ctx
-            self._spans[span_id] = ctx
+        self._span_to_trace[span_id] = trace_id
 
         return span_id
 
@@ -273,16 +434,17 @@ class Tracer:
         metadata:
             Arbitrary data to attach to the span.
         """
-        now_iso = datetime.now(timezone.utc).isoformat()
-        mono = time.monotonic()
-
-        with self._lock:
-            ctx = self._spans.get(span_id)
-            if ctx is None:
-                raise ValueError(f"Unknown span_id: {span_id}")
-            duration_ms = round((mono - ctx._mono_start) * 1000, 2)
-            ctx.end_time = now_iso
-            ctx.status = status
+        now = time.perf_counter_ns()
+
+        trace_id = self._span_to_trace.get(span_id)
+        if trace_id is None:
+            raise ValueError(f"Unknown span_id: {span_id}")
+        trace = self._traces[trace_id]
+        with trace._lock:
+            ctx = trace.spans[span_id]
+            duration_ms = _elapsed_ms(ctx.start_time, now)
+            ctx.end_time = now
+            ctx.status = sys.intern(status)
             ctx.metadata = metadata or {}
             ctx.metadata["_duration_ms"] = duration_ms
 
@@ -301,29 +463,58 @@ class Tracer:
         dict
             Serialised trace including all spans.
         """
-        with self._lock:
-            trace = self._traces.get(trace_id)
-            if trace is None:
-                raise ValueError(f"Unknown trace_id: {trace_id}")
-            return self._serialise_trace(trace)
-
-    def _serialise_trace(self, trace: _Trace) -> Dict[str, Any]:
-        """Build the exported dict for a trace (caller must hold lock)."""
-        duration_ms: Optional[float] = None
-        if hasattr(trace, "_duration_ms"):
-            duration_ms = trace._duration_ms
-
-        spans = []
-        for sid, ctx in trace.spans.items():
-            spans.append(ctx.to_dict())
-
-        # Build a tree structure for nested spans
-        span_by_id = {s["span_id"]: s for s in spans}
+        trace = self._traces.get(trace_id)
+        if trace is None:
+            raise ValueError(f"Unknown trace_id: {trace_id}")
+        # Only the fields end_span/end_trace mutate are read under the
+        # lock; the tree is built from that snapshot after releasing it, so
+        # concurrent start_span/end_span calls wait for a list copy rather
+        # than for the whole serialisation.
+        with trace._lock:
+            state = (trace.end_time, trace.status, trace._duration_ms)
+            spans = [
+                (ctx, ctx.end_time, ctx.status, ctx.metadata)
+                for ctx in trace.spans.values()
+            ]
+        return self._serialise_trace(trace, state, spans)
+
+    @staticmethod
+    def _serialise_trace(
+        trace: _Trace,
+        state: Tuple[Optional[int], str, Optional[float]],
+        spans: List[_SpanSnapshot],
+    ) -> Dict[str, Any]:
+        """Build the exported dict for a trace from a :meth:`get_trace`
+        snapshot."""
+        end_time, status, duration_ms = state
+
+        # Build each span dict directly (dataclasses.asdict is reflective
+        # and deep-copies recursively), then link children to parents.
+        span_by_id: Dict[str, Dict[str, Any]] = {}
+        for ctx, span_end, span_status, metadata in spans:
+            span_by_id[ctx.span_id] = {
+                "trace_id": ctx.trace_id,
+                "span_id": ctx.span_id,
+                "parent_span_id": ctx.parent_span_id,
+                "agent_name": ctx.agent_name,
+                "operation": ctx.operation,
+                "start_time": _iso_from_mono(ctx.start_time),
+                "end_time": _iso_from_mono(span_end),
+                "status": span_status,
+                # Metadata is not mutated after end_span, so a shallow copy
+                # is enough to keep the snapshot independent.
+                "metadata": dict(metadata) if metadata else {},
+                "duration_ms": (
+                    metadata.get("_duration_ms")
+                    if span_end is not None and metadata
+                    else None
+                ),
+                "children": [],
+            }
+
         roots: List[Dict[str, Any]] = []
-        for s in spans:
-            s["children"] = []
-        for s in spans:
-            pid = s.get("parent_span_id")
+        for s in span_by_id.values():
+            pid = s["parent_span_id"]
             if pid and pid in span_by_id:
                 span_by_id[pid]["children"].append(s)
             else:
@@ -332,9 +523,9 @@ class Tracer:
         return {
             "trace_id": trace.trace_id,
             "intent": trace.intent,
-            "start_time": trace.start_time,
-            "end_time": trace.end_time,
-            "status": trace.status,
+            "start_time": _iso_from_mono(trace.start_time),
+            "end_time": _iso_from_mono(end_time),
+            "status": status,
             "duration_ms": duration_ms,
             "spans": roots,
         }
@@ -344,6 +535,10 @@ class Tracer:
     def export_trace(self, trace_id: str, filepath: str) -> str:
         """Write a trace to a JSON file.
 
+        The trace is snapshotted immediately; encoding and writing happen on
+        a background thread.  Call :meth:`flush` to wait for the file (and
+        to surface any write error).
+
         Parameters
         ----------
         trace_id:
@@ -354,39 +549,149 @@ class Tracer:
         Returns
         -------
         str
-            Absolute path of the written file.
+            Absolute path of the file being written.
         """
         dest = Path(filepath).resolve()
         dest.parent.mkdir(parents=True, exist_ok=True)
         data = self.get_trace(trace_id)
-        with open(str(dest), "w", encoding="utf-8") as fh:
-            json.dump(data, fh, indent=2, default=str)
+        _export_writer.submit(data, str(dest), self)
         return str(dest)
 
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until all pending :meth:`export_trace` writes are on disk.
+
+        Re-raises the first error hit while writing one of *this* tracer's
+        exports since the previous flush.
+
+        Parameters
+        ----------
+        timeout:
+            Maximum seconds to wait; ``None`` waits indefinitely.
+
+        Returns
+        -------
+        bool
+            ``True`` if all exports finished, ``False`` on timeout.
+        """
+        finished = _export_writer.flush(timeout)
+        errors = self._take_export_errors()
+        if errors:
+            raise errors[0]
+        return finished
+
+    def _take_export_errors(self) -> List[BaseException]:
+        """Remove and return the export errors recorded so far."""
+        # Slicing and slice deletion are single atomic list operations, so
+        # an error appended by the writer meanwhile is kept for next time.
+        errors = self._export_errors[:]
+        del self._export_errors[:len(errors)]
+        return errors
+
     # -- list / housekeeping ------------------------------------------------
 
+    def disable(self) -> None:
+        """Turn this tracer into a :class:`NullTracer` in place.
+
+        Callers holding a reference keep working unchanged; every lifecycle
+        call becomes a no-op.  Traces recorded before disabling remain
+        available through :meth:`list_traces`.  Assign
+        ``tracer.__class__ = Tracer`` to re-enable.
+        """
+        self.__class__ = NullTracer
+
     def list_traces(self) -> List[Dict[str, Any]]:
         """Return summary info for every known trace."""
-        with self._lock:
-            summaries = []
-            for trace in self._traces.values():
-                duration_ms = getattr(trace, "_duration_ms", None)
-                summaries.append({
-                    "trace_id": trace.trace_id,
-                    "intent": trace.intent,
-                    "status": trace.status,
-                    "start_time": trace.start_time,
-                    "end_time": trace.end_time,
-                    "duration_ms": duration_ms,
-                    "span_count": len(trace.spans),
-                })
-            return summaries
+        # list() copies the registry's values in one atomic C-level step.
+        # Each trace's lock is held only to read its mutable fields
+        # together; formatting happens outside it.
+        summaries = []
+        for trace in list(self._traces.values()):
+            with trace._lock:
+                end_time = trace.end_time
+                status = trace.status
+                duration_ms = trace._duration_ms
+                span_count = len(trace.spans)
+            summaries.append({
+                "trace_id": trace.trace_id,
+                "intent": trace.intent,
+                "status": status,
+                "start_time": _iso_from_mono(trace.start_time),
+                "end_time": _iso_from_mono(end_time),
+                "duration_ms": duration_ms,
+                "span_count": span_count,
+            })
+        return summaries
+
+
+class NullTracer(Tracer):
+    """A :class:`Tracer` that records nothing.
+
+    ``start_trace`` and ``start_span`` return ``""`` and the other lifecycle
+    methods do nothing, so disabled tracing costs a single method call.
+    ``get_trace`` still returns traces recorded before :meth:`Tracer.disable`;
+    for any other ID it returns an empty placeholder trace that
+    :class:`ExecutionReport` can still render.  ``export_trace`` writes
+    nothing and returns ``""``.
+    """
+
+    def start_trace(self, intent: str) -> str:
+        return ""
+
+    def end_trace(self, trace_id: str, status: str = "completed") -> None:
+        pass
+
+    def complete_trace(self, trace_id: str) -> None:
+        pass
+
+    def start_span(
+        self,
+        trace_id: str,
+        agent_name: str,
+        operation: str,
+        parent_span_id: Optional[str] = None,
+    ) -> str:
+        return ""
+
+    def end_span(
+        self,
+        span_id: str,
+        status: str = "ok",
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        pass
+
+    def get_trace(self, trace_id: str) -> Dict[str, Any]:
+        if trace_id in self._traces:
+            return super().get_trace(trace_id)
+        return {
+            "trace_id": trace_id,
+            "intent": "",
+            "start_time": None,
+            "end_time": None,
+            "status": "disabled",
+            "duration_ms": None,
+            "spans": [],
+        }
+
+    def export_trace(self, trace_id: str, filepath: str) -> str:
+        return ""
 
 
 # ---------------------------------------------------------------------------
 # ExecutionReport – human-readable rendering of a trace
 # ---------------------------------------------------------------------------
 
+# Span status -> tree marker for the statuses the workbench emits; any other
+# status falls back to its upper-cased form.
+_STATUS_MARKERS: Dict[str, str] = {
+    "ok": "[OK]",
+    "completed": "[COMPLETED]",
+    "error": "[ERROR]",
+    "timeout": "[TIMEOUT]",
+    "in_progress": "[IN_PROGRESS]",
+}
+
+
 class ExecutionReport:
     """Generates a human-readable execution summary from trace data.
 
@@ -427,26 +732,34 @@ class ExecutionReport:
 
         lines.append("=" * 72)
 
-        # Summary statistics
+        # Summary statistics, gathered in a single pass over the spans
         all_spans = self._flatten_spans(spans)
-        agents = sorted(set(s["agent_name"] for s in all_spans))
+        agent_set = set()
+        ok_count = err_count = 0
+        fastest = slowest = None
+        for s in all_spans:
+            agent_set.add(s["agent_name"])
+            status = s.get("status")
+            if status == "ok":
+                ok_count += 1
+            elif status == "error":
+                err_count += 1
+            dur = s.get("duration_ms")
+            if dur is not None:
+                if fastest is None or dur < fastest:
+                    fastest = dur
+                if slowest is None or dur > slowest:
+                    slowest = dur
+
+        agents = sorted(agent_set)
         lines.append("  SUMMARY")
         lines.append(f"    Total spans : {len(all_spans)}")
         lines.append(f"    Agents      : {', '.join(agents) if agents else 'N/A'}")
-
-        ok_count = sum(1 for s in all_spans if s.get("status") == "ok")
-        err_count = sum(1 for s in all_spans if s.get("status") == "error")
         lines.append(f"    OK spans    : {ok_count}")
         lines.append(f"    Error spans : {err_count}")
-
-        durations = [
-            s["duration_ms"]
-            for s in all_spans
-            if s.get("duration_ms") is not None
-        ]
-        if durations:
-            lines.append(f"    Fastest span: {min(durations):.1f} ms")
-            lines.append(f"    Slowest span: {max(durations):.1f} ms")
+        if fastest is not None:
+            lines.append(f"    Fastest span: {fastest:.1f} ms")
+            lines.append(f"    Slowest span: {slowest:.1f} ms")
 
         lines.append("=" * 72)
         return "\n".join(lines)
@@ -459,41 +772,49 @@ class ExecutionReport:
         lines: List[str],
         indent: int,
     ) -> None:
-        """Recursively render spans as an indented tree."""
-        prefix = " " * indent
-        for span in spans:
+        """Render spans as an indented tree (depth-first, in order)."""
+        # Explicit stack instead of recursion: no frame per span and no
+        # RecursionError on deeply nested traces.  Siblings are pushed in
+        # reverse so they pop in their original order.
+        stack = [(span, indent) for span in reversed(spans)]
+        # Hoist bound-method lookups out of the per-span loop.
+        append = lines.append
+        pop = stack.pop
+        marker_for = _STATUS_MARKERS.get
+        while stack:
+            span, indent = pop()
+            prefix = " " * indent
             dur = span.get("duration_ms")
             dur_str = f"{dur:.1f} ms" if dur is not None else "running"
             status = span.get("status", "unknown")
-            status_marker = "[OK]" if status == "ok" else f"[{status.upper()}]"
+            status_marker = marker_for(status) or f"[{status.upper()}]"
 
-            lines.append(
+            append(
                 f"{prefix}{status_marker} {span['agent_name']}"
                 f" / {span['operation']}"
                 f"  ({dur_str})"
             )
 
             # Show non-private metadata
-            meta = {
-                k: v
-                for k, v in (span.get("metadata") or {}).items()
-                if not k.startswith("_")
-            }
-            if meta:
-                for k, v in meta.items():
-                    lines.append(f"{prefix}    {k}: {v}")
+            metadata = span.get("metadata")
+            if metadata:
+                for k, v in metadata.items():
+                    if not k.startswith("_"):
+                        append(f"{prefix}    {k}: {v}")
 
-            children = span.get("children", [])
+            children = span.get("children")
             if children:
-                self._render_spans(children, lines, indent + 4)
+                stack.extend((child, indent + 4) for child in reversed(children))
 
     @staticmethod
     def _flatten_spans(spans: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Flatten a nested span tree into a single list."""
+        """Flatten a nested span tree into a single list (depth-first)."""
         result: List[Dict[str, Any]] = []
-        for s in spans:
+        stack = list(reversed(spans))
+        while stack:
+            s = stack.pop()
             result.append(s)
-            children = s.get("children", [])
+            children = s.get("children")
             if children:
-                result.extend(ExecutionReport._flatten_spans(children))
+                stack.extend(reversed(children))
         return result
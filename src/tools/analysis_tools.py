@@ -15,14 +15,25 @@ Usage with Google ADK::
     sched_tool = FunctionTool(assess_schedule_criticality)
 """
 
-import copy
 import time
 from typing import Any, Dict, List, Optional
 
-from src.mock_data.evm_data import EVM_METRICS, EVM_HISTORY
-from src.mock_data.ims_data import IMS_MILESTONES, CRITICAL_PATH
-from src.mock_data.risk_data import RISK_REGISTER, RISK_SUMMARY
-from src.mock_data.contract_data import CONTRACT_MODS, CONTRACT_BASELINE
+import numpy as np
+
+from src.mock_data.evm_data import (
+    EVM_HISTORY,
+    EVM_HISTORY_COLUMNS,
+    EVM_METRICS,
+    WORK_PACKAGE_COLUMNS,
+)
+from src.mock_data.frozen import thaw
+from src.mock_data.ims_data import CRITICAL_PATH_MASK, IMS_MILESTONES
+from src.mock_data.risk_data import RISK_COLUMNS, RISK_REGISTER
+from src.mock_data.contract_data import (
+    CONTRACT_MODS,
+    CONTRACT_MODS_BY_NUMBER,
+    CONTRACT_BASELINE,
+)
 from src.mock_data.supplier_data import SUPPLIER_METRICS, QUALITY_ESCAPE_DATA
 from src.observability.logger import log_tool_call
 
@@ -184,9 +195,9 @@ def assess_schedule_criticality(milestone_name: str) -> dict:
 
         # Find the milestone by partial title match
         match = None
-        for m in IMS_MILESTONES:
+        for pos, m in enumerate(IMS_MILESTONES):
             if search in m["title"].lower():
-                match = copy.deepcopy(m)
+                match = thaw(m)
                 break
 
         if match is None:
@@ -199,40 +210,32 @@ def assess_schedule_criticality(milestone_name: str) -> dict:
             }
 
         slip = match["slip_days"]
-        mid = match["milestone_id"]
 
         # Determine if this milestone is on the critical path
-        cp_ids = [
-            entry["milestone_id"]
-            for entry in CRITICAL_PATH["critical_path_sequence"]
-        ]
-        is_cp = mid in cp_ids
+        is_cp = bool(CRITICAL_PATH_MASK[pos])
 
         # Identify downstream milestones: milestones after this one in the
         # overall schedule that share the same WBS lineage or are on the
         # critical path after this node.
         downstream: List[dict] = []
-        milestone_ids_ordered = [m["milestone_id"] for m in IMS_MILESTONES]
-        if mid in milestone_ids_ordered:
-            idx = milestone_ids_ordered.index(mid)
-            for later in IMS_MILESTONES[idx + 1:]:
-                later_copy = copy.deepcopy(later)
-                # Check if downstream milestone is on critical path
-                later_on_cp = later_copy["milestone_id"] in cp_ids
-                # Estimate propagated slip: if this milestone is on the
-                # critical path and the downstream is also on the path,
-                # the slip propagates directly.
-                propagated_slip = slip if (is_cp and later_on_cp) else 0
-                if later_copy["status"] != "completed":
-                    downstream.append({
-                        "milestone_id": later_copy["milestone_id"],
-                        "title": later_copy["title"],
-                        "baseline_date": later_copy["baseline_date"],
-                        "forecast_date": later_copy["forecast_date"],
-                        "current_slip_days": later_copy["slip_days"],
-                        "propagated_slip_days": propagated_slip,
-                        "on_critical_path": later_on_cp,
-                    })
+        for later_pos in range(pos + 1, len(IMS_MILESTONES)):
+            later = IMS_MILESTONES[later_pos]
+            # Check if downstream milestone is on critical path
+            later_on_cp = bool(CRITICAL_PATH_MASK[later_pos])
+            # Estimate propagated slip: if this milestone is on the
+            # critical path and the downstream is also on the path,
+            # the slip propagates directly.
+            propagated_slip = slip if (is_cp and later_on_cp) else 0
+            if later["status"] != "completed":
+                downstream.append({
+                    "milestone_id": later["milestone_id"],
+                    "title": later["title"],
+                    "baseline_date": later["baseline_date"],
+                    "forecast_date": later["forecast_date"],
+                    "current_slip_days": later["slip_days"],
+                    "propagated_slip_days": propagated_slip,
+                    "on_critical_path": later_on_cp,
+                })
 
         # Derive risk level from slip magnitude and critical-path membership
         if slip == 0:
@@ -311,34 +314,41 @@ def calculate_variance_drivers(threshold_percent: float = 5.0) -> dict:
     """
     def _build():
         drivers: List[dict] = []
-
-        for wp in EVM_METRICS["work_packages"]:
-            bcwp = wp["BCWP"]
-            bcws = wp["BCWS"]
-            acwp = wp["ACWP"]
-
-            cv = bcwp - acwp
-            sv = bcwp - bcws
-            cv_pct = (cv / bcwp * 100) if bcwp else 0
-            sv_pct = (sv / bcws * 100) if bcws else 0
-
-            # Check if either variance exceeds the threshold
-            if abs(cv_pct) >= threshold_percent or abs(sv_pct) >= threshold_percent:
-                drivers.append({
-                    "wbs": wp["wbs"],
-                    "title": wp["title"],
-                    "cpi": wp["CPI"],
-                    "spi": wp["SPI"],
-                    "cv": cv,
-                    "sv": sv,
-                    "cv_pct": round(cv_pct, 2),
-                    "sv_pct": round(sv_pct, 2),
-                    "bac": wp["BAC"],
-                    "eac": wp["EAC"],
-                    "total_abs_variance": abs(cv) + abs(sv),
-                    "status": wp["status"],
-                    "variance_explanation": wp["variance_explanation"],
-                })
+        work_packages = EVM_METRICS["work_packages"]
+        cols = WORK_PACKAGE_COLUMNS
+
+        # Compute variances for every work package in one vectorised pass.
+        # The dollar columns are int32; widen so differences and sums of
+        # large variances cannot wrap around.
+        bcwp = cols.BCWP.astype(np.int64)
+        cv = bcwp - cols.ACWP
+        sv = bcwp - cols.BCWS
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cv_pct = np.where(cols.BCWP != 0, cv / cols.BCWP * 100, 0.0)
+            sv_pct = np.where(cols.BCWS != 0, sv / cols.BCWS * 100, 0.0)
+
+        # Flag packages where either variance exceeds the threshold
+        flagged = np.flatnonzero(
+            (np.abs(cv_pct) >= threshold_percent)
+            | (np.abs(sv_pct) >= threshold_percent)
+        )
+        for i in flagged:
+            wp = work_packages[i]
+            drivers.append({
+                "wbs": wp["wbs"],
+                "title": wp["title"],
+                "cpi": wp["CPI"],
+                "spi": wp["SPI"],
+                "cv": int(cv[i]),
+                "sv": int(sv[i]),
+                "cv_pct": round(float(cv_pct[i]), 2),
+                "sv_pct": round(float(sv_pct[i]), 2),
+                "bac": wp["BAC"],
+                "eac": wp["EAC"],
+                "total_abs_variance": abs(int(cv[i])) + abs(int(sv[i])),
+                "status": wp["status"],
+                "variance_explanation": wp["variance_explanation"],
+            })
 
         # Sort by total absolute variance descending (worst first)
         drivers.sort(key=lambda d: d["total_abs_variance"], reverse=True)
@@ -384,30 +394,27 @@ def calculate_risk_exposure() -> dict:
     """
     def _build():
         exposures: List[dict] = []
-        total_cost = 0.0
-        total_sched = 0.0
+        cols = RISK_COLUMNS
 
-        for risk in RISK_REGISTER:
-            prob = risk["probability"]
-            cost_est = risk["cost_impact_estimate"]
-            sched_days = risk["schedule_impact_days"]
-
-            cost_exposure = prob * cost_est
-            sched_exposure = prob * sched_days
-
-            total_cost += cost_exposure
-            total_sched += sched_exposure
+        # Probability-weighted exposures for every risk in one pass
+        cost_exposure = cols.probability * cols.cost_impact_estimate
+        sched_exposure = cols.probability * cols.schedule_impact_days
+        # Totals are accumulated in register order; NumPy's pairwise sum
+        # can round differently (e.g. 131.95 weighted days -> 131.9).
+        total_cost = sum(cost_exposure.tolist())
+        total_sched = sum(sched_exposure.tolist())
 
+        for i, risk in enumerate(RISK_REGISTER):
             exposures.append({
                 "risk_id": risk["risk_id"],
                 "title": risk["title"],
                 "category": risk["category"],
                 "risk_level": risk["risk_level"],
-                "probability": prob,
-                "cost_impact_estimate": cost_est,
-                "cost_exposure": round(cost_exposure, 2),
-                "schedule_impact_days": sched_days,
-                "weighted_schedule_days": round(sched_exposure, 1),
+                "probability": risk["probability"],
+                "cost_impact_estimate": risk["cost_impact_estimate"],
+                "cost_exposure": round(float(cost_exposure[i]), 2),
+                "schedule_impact_days": risk["schedule_impact_days"],
+                "weighted_schedule_days": round(float(sched_exposure[i]), 1),
                 "status": risk["status"],
             })
 
@@ -478,7 +485,7 @@ def assess_supplier_risk(supplier_name: str) -> dict:
         for name, data in SUPPLIER_METRICS.items():
             if search in name.lower():
                 matched_name = name
-                matched_data = copy.deepcopy(data)
+                matched_data = thaw(data)
                 break
 
         if matched_data is None:
@@ -742,7 +749,7 @@ def calculate_cost_of_poor_quality(event_type: str = "quality_escape") -> dict:
                 )
             }
 
-        qe = copy.deepcopy(QUALITY_ESCAPE_DATA)
+        qe = thaw(QUALITY_ESCAPE_DATA)
         cost = qe["cost_impact"]
         bac = EVM_METRICS["BAC"]
 
@@ -814,20 +821,17 @@ def analyze_cpi_trend() -> dict:
         - ``assessment``: Textual interpretation of the trend.
     """
     def _build():
-        history = EVM_HISTORY
+        history = EVM_HISTORY_COLUMNS
         if len(history) < 2:
             return {"error": "Insufficient history data for trend analysis."}
 
-        cpi_series = [(h["period"], h["CPI"]) for h in history]
-        cpi_values = [c for _, c in cpi_series]
+        cpi_series = [(h["period"], h["CPI"]) for h in EVM_HISTORY]
+        cpi_values = history.CPI
 
         # Calculate period-over-period changes
-        changes = [
-            cpi_values[i] - cpi_values[i - 1]
-            for i in range(1, len(cpi_values))
-        ]
-        avg_change = sum(changes) / len(changes)
-        recent_change = changes[-1]
+        changes = np.diff(cpi_values)
+        avg_change = float(changes.mean())
+        recent_change = float(changes[-1])
 
         # Determine trend direction
         if avg_change < -0.005:
@@ -839,7 +843,7 @@ def analyze_cpi_trend() -> dict:
 
         # Detect acceleration: is the rate of decline/improvement getting worse?
         if len(changes) >= 2:
-            recent_delta = changes[-1] - changes[-2]
+            recent_delta = float(changes[-1] - changes[-2])
             # If declining and the change is becoming more negative, it's accelerating
             is_accelerating = (direction == "declining" and recent_delta < -0.002) or \
                               (direction == "improving" and recent_delta > 0.002)
@@ -851,11 +855,11 @@ def analyze_cpi_trend() -> dict:
         # Current reporting period: Oct 2024 = ~37 months in
         # Remaining: ~32 months
         periods_remaining = 32
-        projected_cpi = cpi_values[-1] + (avg_change * periods_remaining)
+        projected_cpi = float(cpi_values[-1]) + (avg_change * periods_remaining)
         # Bound the projection to reasonable limits
         projected_cpi = max(0.50, min(1.20, projected_cpi))
 
-        current_cpi = cpi_values[-1]
+        current_cpi = float(cpi_values[-1])
 
         # Generate assessment
         if direction == "declining":
@@ -940,13 +944,9 @@ def assess_contract_mod_impact(mod_number: str) -> dict:
             return {"error": "mod_number is required."}
 
         # Find the mod
-        matched_mod = None
-        for mod in CONTRACT_MODS:
-            if mod["mod_number"].upper() == search:
-                matched_mod = copy.deepcopy(mod)
-                break
+        mod = CONTRACT_MODS_BY_NUMBER.get(search)
 
-        if matched_mod is None:
+        if mod is None:
             available = [m["mod_number"] for m in CONTRACT_MODS]
             return {
                 "error": (
@@ -954,6 +954,7 @@ def assess_contract_mod_impact(mod_number: str) -> dict:
                     f"Available mods: {available}"
                 )
             }
+        matched_mod = thaw(mod)
 
         original_value = CONTRACT_BASELINE["original_contract_value"]
         cost_impact = matched_mod["cost_impact"]
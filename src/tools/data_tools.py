@@ -14,15 +14,28 @@ Usage with Google ADK::
     evm_tool = FunctionTool(read_evm_metrics)
 """
 
-import copy
 import time
 from typing import Any, Dict
 
+import numpy as np
+
+from src.mock_data.frozen import thaw
 from src.mock_data.program_data import PROGRAM_SNAPSHOT
 from src.mock_data.evm_data import EVM_METRICS, EVM_HISTORY
-from src.mock_data.ims_data import IMS_MILESTONES, CRITICAL_PATH
+from src.mock_data.ims_data import (
+    CRITICAL_PATH,
+    IMS_MILESTONES,
+    KEY_RISK_MASK,
+    MILESTONE_COLUMNS,
+    MilestoneStatus,
+)
 from src.mock_data.risk_data import RISK_REGISTER, RISK_SUMMARY
-from src.mock_data.contract_data import CONTRACT_BASELINE, CONTRACT_MODS, CDRL_LIST
+from src.mock_data.contract_data import (
+    CONTRACT_BASELINE,
+    CONTRACT_MODS,
+    CONTRACT_MODS_BY_NUMBER,
+    CDRL_LIST,
+)
 from src.mock_data.supplier_data import (
     SUPPLIER_METRICS,
     QUALITY_ESCAPE_DATA,
@@ -92,7 +105,7 @@ def read_program_snapshot() -> dict:
     return _safe_call(
         "read_program_snapshot",
         {},
-        lambda: copy.deepcopy(PROGRAM_SNAPSHOT),
+        lambda: thaw(PROGRAM_SNAPSHOT),
     )
 
 
@@ -119,7 +132,7 @@ def read_evm_metrics() -> dict:
     return _safe_call(
         "read_evm_metrics",
         {},
-        lambda: copy.deepcopy(EVM_METRICS),
+        lambda: thaw(EVM_METRICS),
     )
 
 
@@ -141,7 +154,7 @@ def read_evm_history() -> dict:
         - ``latest_period``: Most recent period label in the history.
     """
     def _build():
-        history = copy.deepcopy(EVM_HISTORY)
+        history = thaw(EVM_HISTORY)
         return {
             "periods": history,
             "period_count": len(history),
@@ -172,12 +185,12 @@ def read_ims_milestones() -> dict:
         - ``at_risk_count``: Number of milestones at risk or slipped.
     """
     def _build():
-        milestones = copy.deepcopy(IMS_MILESTONES)
-        cp = copy.deepcopy(CRITICAL_PATH)
-        completed = sum(1 for m in milestones if m["status"] == "completed")
-        at_risk = sum(
-            1 for m in milestones if m["status"] in ("at_risk", "slipped")
-        )
+        milestones = thaw(IMS_MILESTONES)
+        cp = thaw(CRITICAL_PATH)
+        completed = int(np.count_nonzero(
+            MILESTONE_COLUMNS.status == MilestoneStatus.COMPLETED
+        ))
+        at_risk = int(np.count_nonzero(KEY_RISK_MASK))
         return {
             "milestones": milestones,
             "milestone_count": len(milestones),
@@ -206,8 +219,8 @@ def read_risk_register() -> dict:
     """
     def _build():
         return {
-            "risks": copy.deepcopy(RISK_REGISTER),
-            "summary": copy.deepcopy(RISK_SUMMARY),
+            "risks": thaw(RISK_REGISTER),
+            "summary": thaw(RISK_SUMMARY),
         }
 
     return _safe_call("read_risk_register", {}, _build)
@@ -232,7 +245,7 @@ def read_contract_baseline() -> dict:
     return _safe_call(
         "read_contract_baseline",
         {},
-        lambda: copy.deepcopy(CONTRACT_BASELINE),
+        lambda: thaw(CONTRACT_BASELINE),
     )
 
 
@@ -258,13 +271,12 @@ def read_contract_mods(mod_number: str = "") -> dict:
         - ``filter_applied``: The mod_number filter value, or ``None`` if unfiltered.
     """
     def _build():
-        mods = copy.deepcopy(CONTRACT_MODS)
         filter_val = mod_number.strip() if mod_number else None
         if filter_val:
-            mods = [
-                m for m in mods
-                if m["mod_number"].upper() == filter_val.upper()
-            ]
+            match = CONTRACT_MODS_BY_NUMBER.get(filter_val.upper())
+            mods = [thaw(match)] if match is not None else []
+        else:
+            mods = thaw(CONTRACT_MODS)
         return {
             "mods": mods,
             "mod_count": len(mods),
@@ -305,7 +317,7 @@ def read_supplier_metrics(supplier_name: str = "") -> dict:
         - ``filter_applied``: The supplier_name filter value, or ``None``.
     """
     def _build():
-        all_suppliers = copy.deepcopy(SUPPLIER_METRICS)
+        all_suppliers = thaw(SUPPLIER_METRICS)
         filter_val = supplier_name.strip() if supplier_name else None
         if filter_val:
             filtered = {
@@ -348,7 +360,7 @@ def read_quality_escape_data() -> dict:
     return _safe_call(
         "read_quality_escape_data",
         {},
-        lambda: copy.deepcopy(QUALITY_ESCAPE_DATA),
+        lambda: thaw(QUALITY_ESCAPE_DATA),
     )
 
 
@@ -369,7 +381,7 @@ def read_cdrl_list() -> dict:
         - ``in_development_count``: Number of CDRLs in development.
     """
     def _build():
-        cdrls = copy.deepcopy(CDRL_LIST)
+        cdrls = thaw(CDRL_LIST)
         current = sum(1 for c in cdrls if c["status"] == "current")
         in_dev = sum(1 for c in cdrls if c["status"] == "in_development")
         return {
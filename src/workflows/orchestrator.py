@@ -223,6 +223,7 @@ class WorkbenchOrchestrator:
             state.status = WorkbenchStatus.complete
             self.state_manager.save_state(state)
             self.tracer.end_trace(trace_id, "completed")
+            self.tracer.complete_trace(trace_id)
 
             # Generate execution report
             trace_data = self.tracer.get_trace(trace_id)
@@ -250,6 +251,7 @@ class WorkbenchOrchestrator:
         except Exception as e:
             logger.error(f"Orchestration failed: {e}", trace_id=trace_id)
             self.tracer.end_trace(trace_id, "error")
+            self.tracer.complete_trace(trace_id)
             raise
 
     async def _run_parallel_analysis(
@@ -0,0 +1,227 @@
+"""
+Unit tests for memory retrieval and the memory store.
+"""
+
+import threading
+import time
+
+from src.memory import memory_store
+from src.memory.memory_retrieval import MemoryRetriever
+from src.memory.memory_store import WorkbenchMemoryStore, get_shared_store
+
+
+class TestMemoryRetriever:
+    """Test TF-IDF memory retrieval."""
+
+    def test_common_terms_still_affect_ranking(self):
+        """Test that terms present in every document keep their weight."""
+        memories = [
+            {"content": "beta alpha"},
+            {"content": "alpha alpha alpha alpha alpha beta"},
+            {"content": "alpha gamma"},
+            {"content": "alpha delta"},
+        ]
+        results = MemoryRetriever().search_similar("alpha beta", memories=memories)
+
+        assert [(r["content"], r["_relevance_score"]) for r in results] == [
+            ("beta alpha", 0.0323),
+        ]
+
+    def test_unknown_terms_return_nothing(self):
+        """Test that a query with no indexed terms returns no results."""
+        memories = [{"content": "beta alpha"}, {"content": "alpha gamma"}]
+
+        assert MemoryRetriever().search_similar("zzqx", memories=memories) == []
+        assert MemoryRetriever().search_similar("zzqx") == []
+
+    def test_internal_corpus_search(self):
+        """Test searching the built-in contextual memories."""
+        results = MemoryRetriever().search_similar("CPI decline rework", top_k=3)
+
+        assert 0 < len(results) <= 3
+        scores = [r["_relevance_score"] for r in results]
+        assert scores == sorted(scores, reverse=True)
+        assert "rework" in results[0]["content"].lower()
+
+
+def _render_context(facts, categories):
+    """Render the preloaded context the way the store originally did."""
+    lines = ["=" * 72, "PROGRAM HISTORY CONTEXT (Pre-Loaded Memory)", "=" * 72, ""]
+    titles = {
+        "performance_trend": "PAST PERFORMANCE TRENDS",
+        "recurring_pattern": "RECURRING PATTERNS",
+        "past_decision": "PAST DECISIONS",
+        "contract_history": "CONTRACT HISTORY",
+        "supplier_history": "SUPPLIER HISTORY",
+    }
+    for cat_key, title in titles.items():
+        items = [
+            f"- {f['content']}" + (f" [Source: {f['source']}]" if f.get("source") else "")
+            for f in facts
+            if f.get("category", "general") == cat_key
+        ]
+        if items and cat_key in categories:
+            lines.append(f"--- {title} ---")
+            lines.extend(items)
+            lines.append("")
+    lines.append("=" * 72)
+    return "\n".join(lines)
+
+
+class TestPreloadedContext:
+    """Test the pre-rendered program history context."""
+
+    facts = memory_store._PROGRAM_HISTORY_FACTS
+    all_categories = {f["category"] for f in facts}
+
+    def test_full_context_is_unchanged(self):
+        """Test that categories=None renders every section byte for byte."""
+        store = WorkbenchMemoryStore()
+        expected = _render_context(self.facts, self.all_categories)
+
+        assert store.get_preloaded_context() == expected
+        assert store.get_preloaded_context(None) == expected
+        assert store.get_preloaded_context(self.all_categories) == expected
+
+    def test_category_filter(self):
+        """Test that only the requested sections appear, in standard order."""
+        store = WorkbenchMemoryStore()
+        context = store.get_preloaded_context(["contract_history", "past_decision"])
+
+        assert context == _render_context(
+            self.facts, {"past_decision", "contract_history"}
+        )
+        assert context.index("--- PAST DECISIONS ---") < context.index(
+            "--- CONTRACT HISTORY ---"
+        )
+        assert "--- SUPPLIER HISTORY ---" not in context
+        for fact in self.facts:
+            included = fact["category"] in ("past_decision", "contract_history")
+            assert (fact["content"] in context) == included
+
+    def test_unknown_category(self):
+        """Test that unknown or no categories give just the header and footer."""
+        store = WorkbenchMemoryStore()
+        empty = _render_context(self.facts, set())
+
+        assert store.get_preloaded_context(["no_such_category"]) == empty
+        assert store.get_preloaded_context([]) == empty
+        assert store.get_preloaded_context(
+            ["no_such_category", "supplier_history"]
+        ) == _render_context(self.facts, {"supplier_history"})
+
+
+class TestWorkbenchMemoryStore:
+    """Test the workbench memory store's local search."""
+
+    def test_runtime_tag_with_punctuation_matches_query(self):
+        """Test that a hyphenated tag is matched by the same query text."""
+        store = WorkbenchMemoryStore()
+        store.add_memory("Wing assembly jig slipped.", "qa", ["wing-assembly"])
+
+        top = store._local_search("wing-assembly")[0]
+
+        # 1 per content term ("wing", "assembly") + 2 for the tag
+        assert top["content"] == "Wing assembly jig slipped."
+        assert top["_relevance_score"] == 4
+
+    def test_tags_with_spaces_and_non_ascii_match(self):
+        """Test multi-word and non-ASCII tags in local search."""
+        store = WorkbenchMemoryStore()
+        store.add_memory("Fixture rework pending.", "qa", ["Tooling Issue", "qualität"])
+
+        assert [m["content"] for m in store._local_search("tooling issue")] == [
+            "Fixture rework pending.",
+        ]
+        assert [m["content"] for m in store._local_search("Qualität")] == [
+            "Fixture rework pending.",
+        ]
+
+    def test_get_memories_by_tag_is_exact(self):
+        """Test that tag lookup matches whole tags, ignoring case only."""
+        store = WorkbenchMemoryStore()
+        store.add_memory("Fixture rework pending.", "qa", ["Tooling Issue"])
+
+        assert len(store.get_memories_by_tag("tooling issue")) == 1
+        assert store.get_memories_by_tag("tooling-issue") == []
+        assert len(store.get_memories_by_tag("quality")) == 4
+
+    async def test_search_ranks_local_matches(self):
+        """Test ranking and tag matches through the async public search()."""
+        store = WorkbenchMemoryStore()
+        store.add_memory("Gizmo housing cracked.", "qa", ["housing"])
+        store.add_memory("Gizmo calibration overdue.", "qa", ["gizmo-calibration"])
+
+        result = await store.search("gizmo-calibration", app_name="workbench", user_id="u1")
+
+        assert set(result) == {"adk_results", "local_matches"}
+        assert [(m["content"], m["_relevance_score"]) for m in result["local_matches"]] == [
+            ("Gizmo calibration overdue.", 4),  # 2 content terms + 2 for the tag
+            ("Gizmo housing cracked.", 1),
+        ]
+
+    def test_concurrent_add_and_search(self):
+        """Test that concurrent writers index every memory exactly once."""
+        store = WorkbenchMemoryStore()
+        base_count = store.memory_count
+
+        def writer(worker):
+            for i in range(50):
+                store.add_memory(f"marker{worker}x{i} note", f"agent{worker}", ["runtime"])
+                store._local_search(f"marker{worker}x{i}")
+
+        threads = [threading.Thread(target=writer, args=(w,)) for w in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert store.memory_count == base_count + 400
+        assert len(store.get_memories_by_tag("runtime")) == 400
+        for worker in range(8):
+            for i in range(50):
+                matches = store._local_search(f"marker{worker}x{i}")
+                assert [m["content"] for m in matches] == [f"marker{worker}x{i} note"]
+
+
+class TestSharedStore:
+    """Test the process-wide shared store accessor."""
+
+    def test_repeated_calls_return_same_instance(self, monkeypatch):
+        """Test that get_shared_store creates the store once."""
+        monkeypatch.setattr(memory_store, "_shared_store", None)
+
+        store = get_shared_store()
+
+        assert isinstance(store, WorkbenchMemoryStore)
+        assert get_shared_store() is store
+        assert get_shared_store() is store
+
+    def test_concurrent_calls_return_same_instance(self, monkeypatch):
+        """Test that racing first calls still construct a single store."""
+        created = []
+
+        class SlowStore(WorkbenchMemoryStore):
+            def __init__(self):
+                time.sleep(0.05)  # widen the window for a racing caller
+                super().__init__()
+                created.append(self)
+
+        monkeypatch.setattr(memory_store, "_shared_store", None)
+        monkeypatch.setattr(memory_store, "WorkbenchMemoryStore", SlowStore)
+        start = threading.Barrier(8)
+        results = []
+
+        def caller():
+            start.wait()
+            results.append(get_shared_store())
+
+        threads = [threading.Thread(target=caller) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(created) == 1
+        assert len(results) == 8
+        assert all(store is created[0] for store in results)
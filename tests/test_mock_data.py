@@ -0,0 +1,231 @@
+"""
+Unit tests for the mock data query helpers.
+"""
+
+import numpy as np
+import pytest
+
+from src.mock_data.evm_data import (
+    EVM_HISTORY,
+    EVM_METRICS,
+    count_work_packages_by_status,
+    history_slice,
+)
+from src.mock_data.ims_data import (
+    CRITICAL_PATH,
+    IMS_MILESTONES,
+    MILESTONE_COLUMNS,
+    MILESTONE_EDGES,
+    critical_path_view,
+    key_risk_milestones,
+    propagate_slip,
+)
+from src.mock_data.program_data import PROGRAM_SNAPSHOT, rollup_budget, walk_wbs
+from src.mock_data.risk_data import RISK_REGISTER, filter_by_score
+from src.mock_data.supplier_data import (
+    SUPPLIER_COLUMNS,
+    SUPPLIER_METRICS,
+    SupplierColumns,
+)
+
+
+def _positions(*milestone_ids):
+    """Return the IMS_MILESTONES positions of *milestone_ids*."""
+    ids = [m["milestone_id"] for m in IMS_MILESTONES]
+    return [ids.index(mid) for mid in milestone_ids]
+
+
+class TestImsQueries:
+    """Test IMS milestone queries."""
+
+    def test_key_risk_milestones(self):
+        """Test that at-risk and slipped milestones are selected in order."""
+        expected = [
+            i for i, m in enumerate(IMS_MILESTONES)
+            if m["status"] in ("at_risk", "slipped")
+        ]
+
+        assert key_risk_milestones().tolist() == expected
+        assert expected == _positions("MS-006", "MS-008", "MS-009", "MS-010")
+
+    def test_critical_path_view(self):
+        """Test that the critical path view follows the path order."""
+        view = critical_path_view()
+        path_ids = [e["milestone_id"] for e in CRITICAL_PATH["critical_path_sequence"]]
+
+        assert view.milestone_id.tolist() == path_ids
+        records = {m["milestone_id"]: m for m in IMS_MILESTONES}
+        for mid, baseline in zip(path_ids, view.baseline_date):
+            assert str(baseline) == records[mid]["baseline_date"]
+
+    def test_propagate_slip_from_single_source(self):
+        """Test that slip flows to every downstream milestone only."""
+        slip = np.zeros(len(IMS_MILESTONES), dtype=np.int32)
+        (ms005,) = _positions("MS-005")
+        slip[ms005] = 10
+
+        result = propagate_slip(slip)
+
+        downstream = _positions("MS-005", "MS-006", "MS-009", "MS-010")
+        assert np.flatnonzero(result).tolist() == sorted(downstream)
+        assert set(result[downstream].tolist()) == {10}
+        assert slip.sum() == 10  # input left untouched
+
+    def test_propagate_slip_takes_largest_predecessor(self):
+        """Test that a milestone inherits the largest upstream slip."""
+        slip = np.zeros(len(IMS_MILESTONES), dtype=np.int32)
+        ms005, ms008 = _positions("MS-005", "MS-008")
+        slip[ms005] = 10
+        slip[ms008] = 20
+
+        result = propagate_slip(slip)
+
+        ms006, ms009, ms010 = _positions("MS-006", "MS-009", "MS-010")
+        assert result[ms006] == 10
+        assert result[ms009] == 20
+        assert result[ms010] == 20
+
+    def test_propagate_slip_default_respects_every_edge(self):
+        """Test the fixture slip: never reduced, never below a predecessor."""
+        result = propagate_slip()
+
+        for src, dst in MILESTONE_EDGES.tolist():
+            assert result[dst] >= result[src]
+        assert (result >= MILESTONE_COLUMNS.slip_days).all()
+        assert result.tolist() == [0, 7, 3, 4, 12, 30, 0, 16, 30, 30]
+
+
+class TestProgramQueries:
+    """Test WBS traversal and budget rollup."""
+
+    def test_walk_wbs_depth_first(self):
+        """Test that the WBS is walked parent-first, children in order."""
+        order = [node["wbs"] for node in walk_wbs()]
+
+        assert order == [
+            "1.0", "1.1", "1.2", "1.3", "1.3.1", "1.3.2", "1.3.3", "1.3.4",
+            "1.4", "1.5", "1.6", "1.7", "1.8", "1.9",
+        ]
+        assert [node["wbs"] for node in walk_wbs("1.3")] == [
+            "1.3", "1.3.1", "1.3.2", "1.3.3", "1.3.4",
+        ]
+        assert list(walk_wbs("9.9")) == []
+
+    def test_rollup_budget(self):
+        """Test that rollups sum leaf budgets and match the parent totals."""
+        budgets = {n["wbs"]: n["budget"] for n in PROGRAM_SNAPSHOT["wbs_summary"]}
+
+        assert rollup_budget("1.3") == budgets["1.3"] == sum(
+            budgets[w] for w in ("1.3.1", "1.3.2", "1.3.3", "1.3.4")
+        )
+        assert rollup_budget("1.1") == budgets["1.1"]
+        assert rollup_budget() == budgets["1.0"]
+        assert rollup_budget("9.9") == 0
+
+
+class TestRiskQueries:
+    """Test risk register column queries."""
+
+    def test_filter_by_score(self):
+        """Test score filtering against the register records."""
+        for min_score in (0, 8, 12, 20, 25, 26):
+            expected = [
+                i for i, r in enumerate(RISK_REGISTER) if r["risk_score"] >= min_score
+            ]
+            assert filter_by_score(min_score).tolist() == expected
+
+        assert [RISK_REGISTER[i]["risk_id"] for i in filter_by_score(20)] == [
+            "R-001", "R-002",
+        ]
+
+
+class TestEvmQueries:
+    """Test EVM history and work-package queries."""
+
+    def test_history_slice(self):
+        """Test inclusive month slicing of the EVM history."""
+        window = history_slice("2024-07", "2024-09")
+        records = [h for h in EVM_HISTORY if "2024-07" <= h["month"] <= "2024-09"]
+
+        assert [str(m) for m in window.months] == ["2024-07", "2024-08", "2024-09"]
+        assert window.CPI.tolist() == [h["CPI"] for h in records]
+        assert window.cum_ACWP.tolist() == [h["cum_ACWP"] for h in records]
+        assert window.narrative == tuple(h["narrative"] for h in records)
+
+    def test_history_slice_bounds(self):
+        """Test slices that overlap or miss the history range."""
+        assert [str(m) for m in history_slice("2024-01", "2024-05").months] == ["2024-05"]
+        assert len(history_slice("2025-01", "2025-12")) == 0
+        assert len(history_slice("2024-01", "2025-12")) == len(EVM_HISTORY)
+
+    def test_count_work_packages_by_status(self):
+        """Test status counts, case-insensitively, against the records."""
+        statuses = [wp["status"].lower() for wp in EVM_METRICS["work_packages"]]
+
+        for status in ("green", "yellow", "red"):
+            assert count_work_packages_by_status(status) == statuses.count(status)
+        assert count_work_packages_by_status("RED") == statuses.count("red")
+        assert count_work_packages_by_status("purple") == 0
+
+
+class TestSupplierColumns:
+    """Test the column view of the supplier metrics."""
+
+    def test_columns_match_records(self):
+        """Test that every column reads back the published supplier values."""
+        records = list(SUPPLIER_METRICS.values())
+
+        assert SUPPLIER_COLUMNS.name == tuple(SUPPLIER_METRICS)
+        assert SUPPLIER_COLUMNS.otdp.tolist() == [r["otdp"] for r in records]
+        assert SUPPLIER_COLUMNS.dpmo.tolist() == [r["dpmo"] for r in records]
+        assert SUPPLIER_COLUMNS.dpmo_industry_benchmark.tolist() == [
+            r["dpmo_industry_benchmark"] for r in records
+        ]
+
+    def test_otdp_history_matrix(self):
+        """Test the history matrix shape, period labels and change rates."""
+        records = list(SUPPLIER_METRICS.values())
+        periods = tuple(h["period"] for h in records[0]["otdp_history"])
+
+        assert SUPPLIER_COLUMNS.periods == periods
+        assert SUPPLIER_COLUMNS.otdp_history.shape == (len(records), len(periods))
+        for row, r in zip(SUPPLIER_COLUMNS.otdp_history.tolist(), records):
+            assert row == [h["otdp"] for h in r["otdp_history"]]
+        for change, r in zip(SUPPLIER_COLUMNS.otdp_change_per_period(), records):
+            history = [h["otdp"] for h in r["otdp_history"]]
+            assert change == pytest.approx(
+                (history[-1] - history[0]) / (len(history) - 1)
+            )
+
+    def test_full_dpmo_range(self):
+        """Test that DPMO values up to one million are stored exactly."""
+        columns = SupplierColumns.from_metrics({
+            "Worst Case Supplier": {
+                "supplier_id": "SUP-X",
+                "otdp": 0.5,
+                "dpmo": 1_000_000,
+                "dpmo_industry_benchmark": 70_000,
+                "otdp_history": [{"period": "Q1", "otdp": 0.5}],
+            },
+        })
+
+        assert columns.dpmo.tolist() == [1_000_000]
+        assert columns.dpmo_industry_benchmark.tolist() == [70_000]
+        assert columns.otdp_change_per_period().tolist() == [0.0]
+
+    def test_mismatched_history_periods_raise(self):
+        """Test that suppliers must share the same history periods."""
+        def supplier(supplier_id, period):
+            return {
+                "supplier_id": supplier_id,
+                "otdp": 0.9,
+                "dpmo": 100,
+                "dpmo_industry_benchmark": 100,
+                "otdp_history": [{"period": period, "otdp": 0.9}],
+            }
+
+        with pytest.raises(ValueError, match="SUP-B"):
+            SupplierColumns.from_metrics({
+                "A": supplier("SUP-A", "Q1"),
+                "B": supplier("SUP-B", "Q2"),
+            })
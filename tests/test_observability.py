@@ -0,0 +1,425 @@
+"""
+Unit tests for the observability package (logger, tracer, metrics).
+"""
+
+import importlib
+import json
+import logging
+import queue
+import threading
+
+import pytest
+
+import src.observability
+from src.observability import logger as logger_module
+from src.observability.logger import _JSON_FORMATTER, _InProcessQueueHandler
+from src.observability.metrics import MetricsCollector
+from src.observability.tracer import ExecutionReport, NullTracer, Tracer, _ExportWriter
+
+
+class TestPackageExports:
+    """Test the package's lazily resolved re-exports."""
+
+    def test_lazy_names_resolve_to_submodule_objects(self):
+        """Test that every exported name resolves and is listed by dir()."""
+        for name in src.observability.__all__:
+            module_name = src.observability._LAZY_ATTRS[name]
+            module = importlib.import_module(f"src.observability.{module_name}")
+            assert getattr(src.observability, name) is getattr(module, name)
+        assert set(src.observability.__all__) <= set(dir(src.observability))
+
+    def test_unknown_name_raises_attribute_error(self):
+        """Test that names outside the export map still raise AttributeError."""
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            src.observability.missing
+
+
+class TestLogger:
+    """Test the structured logger's background queue."""
+
+    def test_extra_data_is_captured_at_log_time(self):
+        """Test that mutating extra_data after logging does not change the entry."""
+        log_queue = queue.SimpleQueue()
+        handler = _InProcessQueueHandler(log_queue)
+        extra_data = {"step": 1, "items": ["a"]}
+
+        record = logging.LogRecord("t", logging.INFO, "", 0, "hello %s", ("world",), None)
+        record.agent_name = "agent"
+        record.trace_id = "abc"
+        record.extra_data = extra_data
+        handler.handle(record)
+
+        extra_data["step"] = 2
+        extra_data["items"].append("b")
+        extra_data["new"] = True
+
+        entry = json.loads(_JSON_FORMATTER.format(log_queue.get_nowait()))
+        assert entry["message"] == "hello world"
+        assert entry["extra_data"] == {"step": 1, "items": ["a"]}
+        assert entry["trace_id"] == "abc"
+
+    def test_handle_does_not_take_handler_lock(self):
+        """Test that records are queued while another thread holds the lock."""
+        log_queue = queue.SimpleQueue()
+        handler = _InProcessQueueHandler(log_queue)
+        record = logging.LogRecord("t", logging.INFO, "", 0, "queued", None, None)
+
+        with handler.lock:
+            producer = threading.Thread(target=handler.handle, args=(record,))
+            producer.start()
+            producer.join(5)
+            assert not producer.is_alive()
+
+        assert log_queue.get_nowait() is record
+
+    def test_dropped_records_are_reported_once_backlog_clears(self, monkeypatch):
+        """Test drop counting under backlog and the WARNING that follows."""
+        log_queue = queue.SimpleQueue()
+        handler = _InProcessQueueHandler(log_queue)
+        monkeypatch.setattr(logger_module, "_queue_handler", handler)
+        for _ in range(logger_module._LOG_QUEUE_SIZE):
+            log_queue.put_nowait(None)
+
+        def record(level, msg):
+            return logging.LogRecord("t", level, "", 0, msg, None, None)
+
+        handler.handle(record(logging.DEBUG, "dropped"))
+        handler.handle(record(logging.INFO, "dropped"))
+        handler.handle(record(logging.WARNING, "kept"))
+        assert logger_module.dropped_record_count() == 2
+        assert log_queue.qsize() == logger_module._LOG_QUEUE_SIZE + 1
+
+        backlog = [log_queue.get_nowait() for _ in range(log_queue.qsize())]
+        assert backlog[-1].msg == "kept"
+        handler.handle(record(logging.INFO, "after"))
+        handler.handle(record(logging.INFO, "after again"))
+
+        notice = json.loads(_JSON_FORMATTER.format(log_queue.get_nowait()))
+        assert notice["level"] == "WARNING"
+        assert notice["extra_data"] == {
+            "event_type": "log_records_dropped",
+            "dropped": 2,
+            "total_dropped": 2,
+        }
+        assert log_queue.get_nowait().msg == "after"
+        assert log_queue.get_nowait().msg == "after again"
+        assert log_queue.empty()
+        assert logger_module.dropped_record_count() == 2
+
+
+class _BlockingValue:
+    """Value whose JSON encoding (via ``default=str``) waits on an event."""
+
+    def __init__(self, release):
+        self._release = release
+
+    def __str__(self):
+        self._release.wait(5)
+        return "released"
+
+
+class TestTraceExport:
+    """Test background trace export."""
+
+    def test_export_trace_writes_file_after_flush(self, tmp_path):
+        """Test that flush() waits for the exported file to be written."""
+        tracer = Tracer()
+        trace_id = tracer.start_trace("export test")
+        span_id = tracer.start_span(trace_id, "agent", "op")
+        tracer.end_span(span_id, "ok", {"n": 1})
+        tracer.end_trace(trace_id)
+
+        path = tracer.export_trace(trace_id, str(tmp_path / "nested" / "trace.json"))
+        assert tracer.flush(timeout=5) is True
+
+        with open(path, encoding="utf-8") as fh:
+            exported = json.load(fh)
+        assert exported == tracer.get_trace(trace_id)
+        assert exported["spans"][0]["metadata"]["n"] == 1
+
+    def test_flush_timeout_returns_false(self, tmp_path):
+        """Test that flush() returns False while a write is still pending."""
+        writer = _ExportWriter()
+        tracer = Tracer()
+        release = threading.Event()
+        dest = tmp_path / "slow.json"
+        writer.submit({"value": _BlockingValue(release)}, str(dest), tracer)
+
+        assert writer.flush(timeout=0.05) is False
+        release.set()
+        assert writer.flush(timeout=5) is True
+        assert json.loads(dest.read_text(encoding="utf-8")) == {"value": "released"}
+
+    def test_flush_reraises_write_error_once(self, tmp_path):
+        """Test that a failed background write is raised by the next flush."""
+        tracer = Tracer()
+        trace_id = tracer.start_trace("unwritable")
+        # A directory at the destination makes open() fail in the writer.
+        dest = tmp_path / "trace.json"
+        dest.mkdir()
+        tracer.export_trace(trace_id, str(dest))
+
+        with pytest.raises(OSError):
+            tracer.flush(timeout=5)
+        assert tracer.flush(timeout=5) is True
+
+    def test_write_error_is_raised_only_by_its_tracer(self, tmp_path):
+        """Test that one tracer's failed export does not fail another's flush."""
+        failing, healthy = Tracer(), Tracer()
+        dest = tmp_path / "trace.json"
+        dest.mkdir()
+        failing.export_trace(failing.start_trace("unwritable"), str(dest))
+        path = healthy.export_trace(
+            healthy.start_trace("fine"), str(tmp_path / "ok.json")
+        )
+
+        assert healthy.flush(timeout=5) is True
+        with open(path, encoding="utf-8") as fh:
+            assert json.load(fh)["intent"] == "fine"
+        with pytest.raises(OSError):
+            failing.flush(timeout=5)
+
+    def test_atexit_flush_logs_instead_of_raising(self, tmp_path, caplog):
+        """Test that the atexit hook reports write errors without raising."""
+        writer = _ExportWriter()
+        tracer = Tracer()
+        writer.submit({"a": 1}, str(tmp_path / "missing" / "trace.json"), tracer)
+
+        with caplog.at_level(logging.ERROR, logger="src.observability.tracer"):
+            writer._flush_at_exit()
+
+        assert "Trace export failed" in caplog.text
+        assert "FileNotFoundError" in caplog.text
+        assert tracer.flush(timeout=5) is True
+
+
+class TestTracerConcurrency:
+    """Test Tracer under concurrent span updates and reads."""
+
+    def test_concurrent_spans_and_snapshots(self):
+        """Test that readers only ever see consistent span snapshots."""
+        tracer = Tracer()
+        trace_ids = [tracer.start_trace(f"trace {i}") for i in range(2)]
+        spans_per_worker = 200
+        stop = threading.Event()
+        problems = []
+
+        def worker(worker_id):
+            trace_id = trace_ids[worker_id % 2]
+            parent = tracer.start_span(trace_id, f"agent{worker_id}", "root")
+            for i in range(spans_per_worker - 1):
+                span_id = tracer.start_span(trace_id, f"agent{worker_id}", f"op{i}", parent)
+                tracer.end_span(span_id, "ok", {"i": i})
+            tracer.end_span(parent, "completed")
+
+        def reader():
+            while not stop.is_set():
+                for trace_id in trace_ids:
+                    stack = list(tracer.get_trace(trace_id)["spans"])
+                    while stack:
+                        span = stack.pop()
+                        stack.extend(span["children"])
+                        ended = span["end_time"] is not None
+                        if ended != (span["status"] != "in_progress"):
+                            problems.append(span)
+                        if ended != (span["duration_ms"] is not None):
+                            problems.append(span)
+                for summary in tracer.list_traces():
+                    if summary["span_count"] > 4 * spans_per_worker:
+                        problems.append(summary)
+
+        workers = [threading.Thread(target=worker, args=(w,)) for w in range(8)]
+        readers = [threading.Thread(target=reader) for _ in range(2)]
+        for t in readers + workers:
+            t.start()
+        for t in workers:
+            t.join()
+        stop.set()
+        for t in readers:
+            t.join()
+
+        assert problems == []
+        for trace_id in trace_ids:
+            trace = tracer.get_trace(trace_id)
+            roots = trace["spans"]
+            assert len(roots) == 4
+            for root in roots:
+                assert root["status"] == "completed"
+                assert len(root["children"]) == spans_per_worker - 1
+                assert all(c["status"] == "ok" for c in root["children"])
+        assert sorted(s["span_count"] for s in tracer.list_traces()) == [
+            4 * spans_per_worker,
+            4 * spans_per_worker,
+        ]
+
+
+@pytest.fixture
+def metrics():
+    """The MetricsCollector singleton, reset before and after each test."""
+    collector = MetricsCollector()
+    collector.reset()
+    yield collector
+    collector.reset()
+
+
+class TestMetricsCollector:
+    """Test MetricsCollector's per-thread tool-call buffers."""
+
+    def test_pending_samples_are_counted_by_get_summary(self, metrics):
+        """Test counts from live threads still below the buffer flush thresholds."""
+        recorded = threading.Barrier(5)
+        release = threading.Event()
+
+        def worker(worker_id):
+            # 10 samples: well under the 64-sample flush threshold, recorded
+            # quickly enough that the 250 ms interval has not elapsed.
+            for i in range(10):
+                metrics.record_tool_call(f"agent{worker_id % 2}", "lookup", float(i))
+            recorded.wait()
+            release.wait(5)
+
+        threads = [threading.Thread(target=worker, args=(w,)) for w in range(4)]
+        for t in threads:
+            t.start()
+        recorded.wait()
+        try:
+            tool_calls = metrics.get_summary()["tool_calls"]
+        finally:
+            release.set()
+            for t in threads:
+                t.join()
+
+        assert tool_calls["agent0"]["lookup"]["count"] == 20
+        assert tool_calls["agent1"]["lookup"]["count"] == 20
+        latency = tool_calls["agent0"]["lookup"]["latency_ms"]
+        assert latency["min"] == 0.0
+        assert latency["max"] == 9.0
+
+    def test_concurrent_recording_counts_every_call(self, metrics):
+        """Test exact counts when threads cross the flush threshold and exit."""
+        calls_per_thread = 1000
+
+        def worker(worker_id):
+            for i in range(calls_per_thread):
+                metrics.record_tool_call(f"agent{worker_id % 3}", f"tool{i % 2}", 1.0)
+
+        threads = [threading.Thread(target=worker, args=(w,)) for w in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        tool_calls = metrics.get_summary()["tool_calls"]
+        counts = {
+            (agent, tool): stats["count"]
+            for agent, tools in tool_calls.items()
+            for tool, stats in tools.items()
+        }
+        # agent0 gets threads 0, 3, 6; agent1 gets 1, 4, 7; agent2 gets 2, 5
+        assert counts == {
+            ("agent0", "tool0"): 1500, ("agent0", "tool1"): 1500,
+            ("agent1", "tool0"): 1500, ("agent1", "tool1"): 1500,
+            ("agent2", "tool0"): 1000, ("agent2", "tool1"): 1000,
+        }
+        assert sum(counts.values()) == 8 * calls_per_thread
+
+    def test_reset_discards_pending_samples(self, metrics):
+        """Test that reset() drops samples still sitting in thread buffers."""
+        metrics.record_tool_call("agent", "tool", 1.0)
+        metrics.reset()
+
+        assert metrics.get_summary()["tool_calls"] == {}
+
+
+class TestTracerLifecycle:
+    """Test Tracer trace/span lifecycle APIs."""
+
+    def test_end_span_raises_after_complete_trace(self):
+        """Test that complete_trace forgets span IDs but keeps the trace."""
+        tracer = Tracer()
+        trace_id = tracer.start_trace("complete")
+        finished = tracer.start_span(trace_id, "agent", "done")
+        tracer.end_span(finished)
+        still_open = tracer.start_span(trace_id, "agent", "open")
+        tracer.end_trace(trace_id)
+        tracer.complete_trace(trace_id)
+
+        with pytest.raises(ValueError, match="Unknown span_id"):
+            tracer.end_span(still_open)
+        with pytest.raises(ValueError, match="Unknown span_id"):
+            tracer.end_span(finished)
+        assert tracer._span_to_trace == {}
+        assert len(tracer.get_trace(trace_id)["spans"]) == 2
+
+    def test_complete_trace_leaves_other_traces_alone(self):
+        """Test that only the completed trace's spans are forgotten."""
+        tracer = Tracer()
+        done = tracer.start_trace("done")
+        tracer.start_span(done, "agent", "op")
+        active = tracer.start_trace("active")
+        span_id = tracer.start_span(active, "agent", "op")
+        tracer.end_trace(done)
+        tracer.complete_trace(done)
+
+        tracer.end_span(span_id, "ok")
+        assert tracer.get_trace(active)["spans"][0]["status"] == "ok"
+
+    def test_complete_trace_unknown_id(self):
+        """Test that complete_trace rejects unknown trace IDs."""
+        with pytest.raises(ValueError, match="Unknown trace_id"):
+            Tracer().complete_trace("missing")
+
+    def test_disable_turns_tracer_into_null_tracer(self, tmp_path):
+        """Test that disable() makes every call a no-op."""
+        tracer = Tracer()
+        recorded = tracer.start_trace("before disable")
+        tracer.disable()
+
+        assert isinstance(tracer, NullTracer)
+        trace_id = tracer.start_trace("ignored")
+        span_id = tracer.start_span(trace_id, "agent", "op")
+        assert trace_id == ""
+        assert span_id == ""
+        tracer.end_span(span_id, "ok", {"a": 1})
+        tracer.end_span("no-such-span")
+        tracer.end_trace(trace_id)
+        tracer.complete_trace(trace_id)
+
+        assert tracer.get_trace(trace_id) == {
+            "trace_id": "",
+            "intent": "",
+            "start_time": None,
+            "end_time": None,
+            "status": "disabled",
+            "duration_ms": None,
+            "spans": [],
+        }
+        assert "(no spans recorded)" in ExecutionReport(tracer.get_trace(trace_id)).render()
+        assert tracer.export_trace(trace_id, str(tmp_path / "trace.json")) == ""
+        assert list(tmp_path.iterdir()) == []
+        assert [t["trace_id"] for t in tracer.list_traces()] == [recorded]
+
+    def test_traces_recorded_before_disable_stay_readable(self):
+        """Test that get_trace still returns traces listed by list_traces."""
+        tracer = Tracer()
+        trace_id = tracer.start_trace("before disable")
+        span_id = tracer.start_span(trace_id, "agent", "op")
+        tracer.end_span(span_id, "ok", {"n": 1})
+        tracer.end_trace(trace_id)
+        expected = tracer.get_trace(trace_id)
+        tracer.disable()
+
+        for summary in tracer.list_traces():
+            assert tracer.get_trace(summary["trace_id"]) == expected
+        assert tracer.get_trace(trace_id)["spans"][0]["metadata"]["n"] == 1
+        assert tracer.get_trace("unknown")["status"] == "disabled"
+
+    def test_reenable_after_disable(self):
+        """Test that restoring the class re-enables tracing."""
+        tracer = Tracer()
+        tracer.disable()
+        tracer.__class__ = Tracer
+
+        trace_id = tracer.start_trace("re-enabled")
+        assert trace_id != ""
+        assert tracer.get_trace(trace_id)["intent"] == "re-enabled"
@@ -25,6 +25,8 @@ from src.tools.analysis_tools import (
     assess_contract_mod_impact,
 )
 from src.tools.tool_registry import ToolRegistry
+from src.tools import analysis_tools
+from src.mock_data.evm_data import WorkPackageColumns
 
 
 class TestDataTools:
@@ -167,6 +169,26 @@ class TestAnalysisTools:
         assert "drivers" in result
         assert "threshold_percent" in result
 
+    def test_calculate_variance_drivers_large_variances(self, monkeypatch):
+        """Test that variances beyond the int32 range are summed exactly."""
+        wp = {
+            "wbs": "9.9", "title": "Large package", "status": "red",
+            "BCWP": 2_000_000_000, "BCWS": 100_000_000, "ACWP": 100_000_000,
+            "CPI": 20.0, "SPI": 20.0, "BAC": 2_100_000_000, "EAC": 2_100_000_000,
+            "variance_explanation": "",
+        }
+        monkeypatch.setattr(analysis_tools, "EVM_METRICS", {"work_packages": [wp]})
+        monkeypatch.setattr(
+            analysis_tools,
+            "WORK_PACKAGE_COLUMNS",
+            WorkPackageColumns.from_records([wp]),
+        )
+
+        (driver,) = calculate_variance_drivers(5.0)["drivers"]
+
+        assert driver["cv"] == driver["sv"] == 1_900_000_000
+        assert driver["total_abs_variance"] == 3_800_000_000
+
     def test_analyze_cpi_trend(self):
         """Test CPI trend analysis."""
         result = analyze_cpi_trend()